@@ -8,8 +8,6 @@ A Railway Oriented Programming framework that provides:
 - ExitContract for type-safe workflow termination
 """
 
-from importlib.metadata import version
-
 from railway.core.board import BoardBase, WorkflowResult
 from railway.core.contract import Contract, Params, Tagged, validate_contract
 from railway.core.decorators import Retry, entry_point, node
@@ -24,8 +22,7 @@ from railway.core.resolver import (
 )
 from railway.core.retry import RetryPolicy
 
-__version__ = version("railway-framework")
-__all__ = [
+__all__ = (
     # Core decorators
     "entry_point",
     "node",
@@ -52,4 +49,19 @@ __all__ = [
     "get_contract",
     # ExitContract (for DAG workflow termination)
     "ExitContract",
-]
+)
+
+
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` lazily (PEP 562).
+
+    The installed distribution metadata is only read on first access and
+    the result is cached in the module namespace.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("railway-framework")
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,33 @@
+"""Raw file writes shared by the scaffolding commands (init, new)."""
+
+import os
+from pathlib import Path
+
+# Raw byte writes: no text-layer buffering or newline translation.
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+CREATE_NEW_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def open_and_write(path: str | Path, content: bytes, flags: int) -> None:
+    """Write encoded content with a single open/write/close."""
+    fd = os.open(path, flags, 0o666)
+    try:
+        data = memoryview(content)
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def write_new_file(path: str | Path, content: bytes) -> bool:
+    """Create a file with content, leaving an existing file untouched.
+
+    O_EXCL makes the existence check and the create one syscall, so files
+    the user already has are never read or truncated. Returns False if the
+    path was already taken.
+    """
+    try:
+        open_and_write(path, content, CREATE_NEW_FLAGS)
+    except FileExistsError:
+        return False
+    return True
@@ -1,14 +1,26 @@
 """railway init command implementation."""
 
+import os
+import re
+import shutil
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+from typing import Annotated, Any
 
 import typer
 
-from railway import __version__
-from railway.core.project_metadata import create_metadata, save_metadata
+from railway.cli._fs import WRITE_FLAGS, open_and_write, write_new_file
 
+# Matches exactly the ASCII names that are identifiers once "-" becomes "_".
+_ASCII_PROJECT_NAME_PATTERN = re.compile(r"[A-Za-z_-][A-Za-z0-9_-]*")
 
+
+@lru_cache(maxsize=32)
 def _compute_version_constraint(version: str) -> str:
     """バージョン文字列から互換性制約を計算する（純粋関数）。
 
@@ -33,38 +45,115 @@ def _compute_version_constraint(version: str) -> str:
     return f">={lower},<{v.major}.{next_minor}.0"
 
 
+@lru_cache(maxsize=256)
 def _validate_project_name(name: str) -> str:
     """
     Validate and normalize project name.
 
     Replaces dashes with underscores for Python compatibility.
+    ASCII names are checked in a single pass by a precompiled pattern that
+    accepts dashes, so the replacement only happens for valid names;
+    non-ASCII names fall back to str.isidentifier(). Pure, so results are
+    memoized; invalid names raise and are not cached.
     """
-    normalized = name.replace("-", "_")
-    if not normalized.isidentifier():
+    if name.isascii():
+        valid = _ASCII_PROJECT_NAME_PATTERN.fullmatch(name) is not None
+    else:
+        valid = name.replace("-", "_").isidentifier()
+    if not valid:
         raise typer.BadParameter(f"'{name}' is not a valid Python identifier")
-    return normalized
+    return name.replace("-", "_")
+
+
+# Every scaffold directory, parents before children, so each one is created
+# with a single mkdir call.
+_PROJECT_DIRECTORIES: tuple[str, ...] = (
+    "src",
+    "src/nodes",
+    "src/common",
+    "src/contracts",
+    "tests",
+    "tests/nodes",
+    "config",
+    "logs",
+    "transition_graphs",
+    "_railway",
+    "_railway/generated",
+)
 
+def _write_file(
+    path: str | Path, content: str | bytes, kept: list[str] | None = None
+) -> None:
+    """Write content to a file as UTF-8 with a single open/write/close.
 
-def _create_directory(path: Path) -> None:
-    """Create a directory if it doesn't exist."""
-    path.mkdir(parents=True, exist_ok=True)
+    Static scaffold files are pre-encoded at import time and passed as
+    bytes; only templated content is encoded per call. Empty content only
+    creates (or truncates) the file without issuing a write.
 
+    When ``kept`` is given, an existing file is left untouched and its
+    path is appended to ``kept`` instead.
+    """
+    data = content.encode() if isinstance(content, str) else content
+    if kept is None:
+        open_and_write(path, data, WRITE_FLAGS)
+    elif not write_new_file(path, data):
+        kept.append(os.fspath(path))
 
-def _write_file(path: Path, content: str) -> None:
-    """Write content to a file."""
-    path.write_text(content)
 
+def _write_chunks(path: str | Path, chunks: Sequence[bytes]) -> None:
+    """Write pre-encoded chunks to a file without joining them first.
 
-def _create_pyproject_toml(project_path: Path, project_name: str, python_version: str) -> None:
-    """Create pyproject.toml file."""
-    version_constraint = _compute_version_constraint(__version__)
-    content = f'''[project]
-name = "{project_name}"
+    Uses a single gathering os.writev where available (POSIX) and falls
+    back to one joined write elsewhere.
+    """
+    if not hasattr(os, "writev"):
+        _write_file(path, b"".join(chunks))
+        return
+    fd = os.open(path, WRITE_FLAGS, 0o666)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            rest = memoryview(b"".join(chunks))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest) :]
+    finally:
+        os.close(fd)
+
+
+# Pre-encoded static fragments and the slot names between them
+_SplitTemplate = tuple[tuple[bytes, ...], tuple[str, ...]]
+
+
+def _split_template(
+    template: Template, slots: tuple[str, ...] = ("project_name",)
+) -> _SplitTemplate:
+    """Pre-encode a template once, split around each ``$slot`` occurrence.
+
+    Returns the static fragments and, for each gap between them, the name
+    of the slot that fills it. Rendering then only needs to encode the slot
+    values (see _write_template).
+    """
+    parts = template.substitute({slot: f"\0{slot}\0" for slot in slots}).split("\0")
+    return tuple(part.encode() for part in parts[::2]), tuple(parts[1::2])
+
+
+def _write_template(path: str | Path, template: _SplitTemplate, **values: str) -> None:
+    """Write a template pre-split by _split_template with its slots filled in."""
+    statics, slots = template
+    encoded = {slot: value.encode() for slot, value in values.items()}
+    chunks = [statics[0]]
+    for slot, static in zip(slots, statics[1:]):
+        chunks += (encoded[slot], static)
+    _write_chunks(path, chunks)
+
+
+_PYPROJECT_TEMPLATE = Template('''[project]
+name = "$project_name"
 version = "0.1.0"
 description = "Railway framework automation project"
-requires-python = ">={python_version}"
+requires-python = ">=$python_version"
 dependencies = [
-    "railway-framework{version_constraint}",
+    "railway-framework$version_constraint",
     "loguru>=0.7.0",
     "pydantic>=2.0.0",
     "pydantic-settings>=2.0.0",
@@ -95,30 +184,54 @@ packages = ["src"]
 mypy_path = "src"
 explicit_package_bases = true
 ignore_missing_imports = true
-'''
-    _write_file(project_path / "pyproject.toml", content)
+''')
 
+_PYPROJECT_FRAGMENTS = _split_template(
+    _PYPROJECT_TEMPLATE, ("project_name", "python_version", "version_constraint")
+)
 
-def _create_env_example(project_path: Path, project_name: str) -> None:
-    """Create .env.example file."""
-    content = f'''# Environment (development/staging/production)
+
+def _create_pyproject_toml(project_path: Path, project_name: str, python_version: str) -> None:
+    """Create pyproject.toml file."""
+    # Resolved on use: reading the installed version touches package metadata
+    from railway import __version__
+
+    _write_template(
+        os.path.join(project_path, "pyproject.toml"),
+        _PYPROJECT_FRAGMENTS,
+        project_name=project_name,
+        python_version=python_version,
+        version_constraint=_compute_version_constraint(__version__),
+    )
+
+
+_ENV_EXAMPLE_TEMPLATE = Template('''# Environment (development/staging/production)
 RAILWAY_ENV=development
 
 # Application
-APP_NAME={project_name}
+APP_NAME=$project_name
 
 # Log Level Override (optional)
 LOG_LEVEL=DEBUG
-'''
-    _write_file(project_path / ".env.example", content)
+''')
 
 
-def _create_development_yaml(project_path: Path, project_name: str) -> None:
-    """Create config/development.yaml file."""
-    content = f'''# Railway Framework Configuration - Development
+_ENV_EXAMPLE_FRAGMENTS = _split_template(_ENV_EXAMPLE_TEMPLATE)
+
+
+def _create_env_example(project_path: Path, project_name: str) -> None:
+    """Create .env.example file."""
+    _write_template(
+        os.path.join(project_path, ".env.example"),
+        _ENV_EXAMPLE_FRAGMENTS,
+        project_name=project_name,
+    )
+
+
+_DEVELOPMENT_YAML_TEMPLATE = Template('''# Railway Framework Configuration - Development
 
 app:
-  name: {project_name}
+  name: $project_name
   version: "0.1.0"
 
 api:
@@ -127,7 +240,7 @@ api:
 
 logging:
   level: DEBUG
-  format: "{{time:HH:mm:ss}} | {{level}} | {{message}}"
+  format: "{time:HH:mm:ss} | {level} | {message}"
   handlers:
     - type: console
       level: DEBUG
@@ -137,767 +250,89 @@ retry:
     max_attempts: 3
     min_wait: 2
     max_wait: 10
-'''
-    _write_file(project_path / "config" / "development.yaml", content)
-
-
-def _create_settings_py(project_path: Path) -> None:
-    """Create src/settings.py file."""
-    content = '''"""Application settings."""
-
-from railway.core.settings import Settings, get_settings, reset_settings
-
-# Re-export for convenience
-__all__ = ["Settings", "get_settings", "reset_settings", "settings"]
-
-# Lazy settings proxy
-settings = get_settings()
-'''
-    _write_file(project_path / "src" / "settings.py", content)
-
-
-def _get_tutorial_content(project_name: str) -> str:
-    """TUTORIALテンプレートの内容を生成する（純粋関数）。
-
-    Args:
-        project_name: プロジェクト名
-
-    Returns:
-        TUTORIAL.md のテンプレート文字列
-    """
-    name = project_name
-    return f'''# {name} チュートリアル
-
-Railway Framework の**DAGワークフロー（Board モード）**を体験しましょう！
-
-## 学べること
-
-- dag_runner による条件分岐ワークフロー
-- Board パターン（ミュータブル共有状態）
-- Outcome クラスによる状態返却
-- WorkflowResult による結果取得
-- 遷移グラフ（YAML）の定義
-- コード生成（railway sync transition）
-- Trace モードによるデバッグ
-- バージョン管理と安全なアップグレード
-
-## 所要時間
-
-約15分
-
-## 前提条件
-
-- Python 3.10以上
-- uv インストール済み（`curl -LsSf https://astral.sh/uv/install.sh | sh`）
-- VSCode推奨（IDE補完を体験するため）
-
-## セットアップ
-
-```bash
-uv sync --group dev
-cp .env.example .env
-```
-
----
-
-## Step 1: Hello World（2分）
-
-まずは動作確認から。
-
-### 1.1 実行
-
-```bash
-uv run railway run hello
-```
-
-**期待される出力:**
-```
-Hello, World!
-```
-
-次のStepでは、DAGワークフローの核心を学びます。
-
----
-
-## Step 2: はじめてのDAGワークフロー（5分）
-
-DAGワークフローでは、条件分岐を含むワークフローを定義できます。
-
-### 2.1 エントリーポイント作成
-
-```bash
-railway new entry greeting
-```
-
-以下のファイルが生成されます：
-
-- `src/greeting.py` - エントリーポイント（dag_runner使用）
-- `src/nodes/greeting/start.py` - 開始ノード（Board モード）
-- `transition_graphs/greeting_*.yml` - 遷移グラフ定義
-
-### 2.2 すぐに実行可能！
-
-`railway new entry` は自動的にコード生成も行います。
-
-```bash
-railway run greeting
-```
+''')
 
-**期待される出力:**
-```
-Running entry point: greeting
-... (ログ出力)
-✓ 完了 (exit_state=success.done)
-```
 
-> **Note:** 実際の出力にはタイムスタンプとログレベルが含まれます（loguru による stderr 出力）。
+_DEVELOPMENT_YAML_FRAGMENTS = _split_template(_DEVELOPMENT_YAML_TEMPLATE)
 
-### 2.3 遷移グラフを確認
 
-`transition_graphs/greeting_*.yml` を開いて確認してください:
-
-```yaml
-version: "1.0"
-entrypoint: greeting
-description: "greeting ワークフロー"
-
-nodes:
-  start:
-    module: nodes.greeting.start
-    function: start
-    description: "開始ノード"
-
-  # 終端ノードは nodes.exit 配下に定義
-  exit:
-    success:
-      done:
-        description: "正常終了"
-    failure:
-      error:
-        description: "エラー終了"
-
-start: start
-
-transitions:
-  start:
-    success::done: exit.success.done
-    failure::error: exit.failure.error
-```
-
-編集後は再同期：
-
-```bash
-railway sync transition --entry greeting
-```
-
----
-
-## Step 3: ノードの実装 - Board と Outcome を使う（3分）
-
-DAGワークフローのノードは `board`（共有状態）を受け取り、`Outcome` を返す純粋関数です。
-
-### 3.1 Board モードのノード基本形
-
-`src/nodes/greeting/start.py` を確認:
-
-```python
-from railway import node
-from railway.core.dag import Outcome
-
-
-@node
-def start(board) -> Outcome:
-    \"\"\"開始ノード
-
-    Args:
-        board: Board（共有状態）
-    \"\"\"
-    # board にデータを書き込む
-    board.message = "Hello, Railway!"
-    return Outcome.success("done")
-```
-
-**Board モードの特徴:**
-- ノードは `board` を受け取り `Outcome` のみを返す
-- `board` に直接属性を読み書きする（`model_copy` 不要）
-- Contract 定義なしでシンプルに実装可能
-- `railway sync transition` が AST 解析でフィールド依存を自動検出
-
-### 3.2 Outcome クラス
-
-`Outcome` は状態を簡潔に表現します:
-
-```python
-# 成功状態
-Outcome.success("done")      # → success::done
-Outcome.success("validated") # → success::validated
-
-# 失敗状態
-Outcome.failure("error")     # → failure::error
-Outcome.failure("timeout")   # → failure::timeout
-```
-
-**ポイント:**
-- ノードは状態を返すだけ
-- 次のノードへの遷移はYAMLで定義
-- 純粋関数として実装
-
-### 3.3 WorkflowResult
-
-dag_runner は `WorkflowResult` を返します:
-
-```python
-from railway.core.board import WorkflowResult
-
-result = dag_runner(start=start, transitions=TRANSITIONS, board=board)
-result.is_success      # True if exit_code == 0
-result.exit_code       # 0 (success) or 1 (failure)
-result.exit_state      # "success.done" など
-result.board           # board オブジェクト（最終状態）
-result.execution_path  # ("start", "process", "exit.success.done")
-result.iterations      # 実行したノード数
-result.trace           # トレース情報（--trace 指定時のみ）
-```
-
-### 3.4 Contract（型契約）との関係
-
-Board モードは DAG ワークフローの新しいデフォルトです。
-Contract は線形パイプライン（`typed_pipeline`）で引き続き使用されます。
-
-| 用途 | パターン | 入出力 |
-|------|----------|--------|
-| DAGワークフロー（推奨） | Board モード | `board` → `Outcome` |
-| 線形パイプライン | Contract モード | `Contract` → `Contract` |
+def _create_development_yaml(project_path: Path, project_name: str) -> None:
+    """Create config/development.yaml file."""
+    _write_template(
+        os.path.join(project_path, "config", "development.yaml"),
+        _DEVELOPMENT_YAML_FRAGMENTS,
+        project_name=project_name,
+    )
 
----
 
-## Step 4: 条件分岐ワークフロー（5分）
+_SETTINGS_PY_CONTENT: bytes = b'''"""Application settings."""
 
-時間帯に応じて挨拶を変えるワークフローを作成します。
+from railway.core.settings import Settings, get_settings, reset_settings
 
-### 4.1 遷移グラフを編集
+# Re-export for convenience
+__all__ = ["Settings", "get_settings", "reset_settings", "settings"]
 
-`transition_graphs/greeting_*.yml` を以下のように編集:
+# Declared for static tools; resolved on first access by __getattr__ below
+settings: Settings
 
-```yaml
-version: "1.0"
-entrypoint: greeting
-description: "挨拶ワークフロー"
 
-nodes:
-  check_time:
-    description: "時間帯を判定"
-  greet_morning:
-    description: "朝の挨拶"
-  greet_afternoon:
-    description: "午後の挨拶"
-  greet_evening:
-    description: "夜の挨拶"
-
-  # 終端ノード
-  exit:
-    success:
-      done:
-        description: "正常終了"
+def __getattr__(name: str) -> Settings:
+    """Load settings on first access to ``settings`` (PEP 562).
 
-start: check_time
+    Importing this module does not read config files or the environment.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
 
-transitions:
-  check_time:
-    success::morning: greet_morning
-    success::afternoon: greet_afternoon
-    success::evening: greet_evening
-  greet_morning:
-    success::done: exit.success.done
-  greet_afternoon:
-    success::done: exit.success.done
-  greet_evening:
-    success::done: exit.success.done
-```
 
-**ポイント:**
-- `module/function` は省略可能（`nodes.{{entrypoint}}.{{ノード名}}` に自動解決）
-- 例: `check_time` → `nodes.greeting.check_time` に解決
-- 終端ノードは `nodes.exit` 配下に定義（entrypoint を含まない）
-- 遷移先は `exit.success.done` 形式で指定
+def _create_settings_py(project_path: Path) -> None:
+    """Create src/settings.py file."""
+    _write_file(os.path.join(project_path, "src", "settings.py"), _SETTINGS_PY_CONTENT)
 
-### 4.2 ノードを実装
 
-Board モードでは `board` に直接読み書きし、`Outcome` を返します。
+@lru_cache(maxsize=1)
+def _tutorial_template() -> Template:
+    """Load the TUTORIAL.md template from package data on first use.
 
-`src/nodes/greeting/check_time.py`:
+    The body is large, so it lives in templates/tutorial.md.tpl instead of
+    being a module constant loaded by every CLI command.
+    """
+    from importlib import resources
 
-```python
-from datetime import datetime
-from railway import node
-from railway.core.dag import Outcome
+    source = resources.files("railway.cli").joinpath("templates").joinpath("tutorial.md.tpl")
+    return Template(source.read_text(encoding="utf-8"))
 
 
-@node
-def check_time(board) -> Outcome:
-    \"\"\"時間帯を判定して状態を返す
+def _get_tutorial_content(project_name: str) -> str:
+    """TUTORIALテンプレートの内容を生成する（純粋関数）。
 
     Args:
-        board: Board（共有状態）
-    \"\"\"
-    hour = datetime.now().hour
-
-    if 5 <= hour < 12:
-        board.period = "morning"
-        return Outcome.success("morning")
-    elif 12 <= hour < 18:
-        board.period = "afternoon"
-        return Outcome.success("afternoon")
-    else:
-        board.period = "evening"
-        return Outcome.success("evening")
-```
-
-**Board モードの利点:**
-- Contract 定義が不要（`board.period = "morning"` で直接書き込み）
-- `model_copy` が不要（`board` はミュータブル）
-- `tuple` 返り値が不要（`Outcome` のみ返す）
-- `railway sync transition` が `board.period` を AST 解析で自動検出
-
-**テスト時の初期状態注入:**
-
-```python
-from railway.core.board import BoardBase
-
-board = BoardBase(hour_override=10)  # テスト用の初期状態
-outcome = check_time(board)
-```
-
-これにより、**テスト時に任意の初期状態を注入できます**。
-
-`src/nodes/greeting/greet_morning.py`:
-
-```python
-from railway import node
-from railway.core.dag import Outcome
-
-
-@node
-def greet_morning(board) -> Outcome:
-    \"\"\"朝の挨拶\"\"\"
-    print("おはようございます！")
-    board.greeting = "おはようございます！"
-    return Outcome.success("done")
-```
-
-`src/nodes/greeting/greet_afternoon.py`:
-
-```python
-from railway import node
-from railway.core.dag import Outcome
-
-
-@node
-def greet_afternoon(board) -> Outcome:
-    \"\"\"午後の挨拶\"\"\"
-    print("こんにちは！")
-    board.greeting = "こんにちは！"
-    return Outcome.success("done")
-```
-
-`src/nodes/greeting/greet_evening.py`:
-
-```python
-from railway import node
-from railway.core.dag import Outcome
-
-
-@node
-def greet_evening(board) -> Outcome:
-    \"\"\"夜の挨拶\"\"\"
-    print("こんばんは！")
-    board.greeting = "こんばんは！"
-    return Outcome.success("done")
-```
-
-**ポイント:**
-- `module/function` を省略すると、ノード名からファイルが自動解決される
-- 例: `greet_morning` → `nodes.greeting.greet_morning` モジュールの `greet_morning` 関数
-
-**応用: module 明示パターン**
-
-1ファイルに複数関数を配置したい場合は、YAML で `module` を明示できます:
-
-```yaml
-# YAML で module を明示すれば、1 ファイルに複数関数を配置可能
-nodes:
-  greet_morning:
-    module: nodes.greeting.greet
-    function: greet_morning
-  greet_afternoon:
-    module: nodes.greeting.greet
-    function: greet_afternoon
-  greet_evening:
-    module: nodes.greeting.greet
-    function: greet_evening
-```
-
-### 4.3 コード生成と実行
-
-```bash
-# コード生成
-railway sync transition --entry greeting
-
-# 実行
-railway run greeting
-```
-
-出力例:
-
-```
-Running entry point: greeting
-... (ログ出力)
-✓ 完了 (exit_state=success.done)
-```
-
----
-
-## Step 5: railway new node でノードを素早く追加（3分）
-
-既存のワークフローに新しいノードを追加する方法を学びます。
-ここで体験するのは「**ファイルを1コマンドで生成し、即座にTDDを開始できる**」という恩恵です。
-
-### 5.1 1コマンドで2ファイル生成
-
-```bash
-railway new node log_result
-```
-
-**たった1コマンドで以下が生成されます:**
-
-| ファイル | 役割 | 恩恵 |
-|----------|------|------|
-| `src/nodes/log_result.py` | ノード本体 | 動作するサンプル付き |
-| `tests/nodes/test_log_result.py` | テスト | すぐにTDD開始可能 |
-
-> **Note:** Board モードでは Contract ファイルは生成されません。
-> board に直接読み書きするため、別途 Contract 定義が不要です。
-
-### 5.2 TDDワークフローを体験
-
-**Step 1: テストを編集（期待する動作を定義）**
-
-`tests/nodes/test_log_result.py` を開き、具体的なテストを追加。
-
-**Step 2: テスト実行（失敗を確認 = Red）**
-
-```bash
-uv run pytest tests/nodes/test_log_result.py -v
-```
-
-失敗することを確認。これがTDDの「Red」フェーズです。
-
-**Step 3: 実装（テストを通す = Green）**
-
-`src/nodes/log_result.py` を実装。
-
-**Step 4: テスト再実行（成功を確認）**
-
-成功！これがTDDの「Green」フェーズです。
-
-### 5.3 階層ノード
-
-ドット区切りでサブディレクトリにノードを生成できます。
-YAML の深いネスト定義と一貫した形式です。
-
-```bash
-railway new node processing.validate
-```
-
-**生成されるファイル:**
-
-| ファイル | 内容 |
-|----------|------|
-| `src/nodes/processing/validate.py` | `def validate(board)` - 関数名は最終セグメント |
-| `tests/nodes/processing/test_validate.py` | TDDテンプレート |
-
-3段以上のネストも可能です:
-
-```bash
-railway new node sub.deep.process
-# → src/nodes/sub/deep/process.py（関数名: process）
-```
-
-**注意: 名前のバリデーション**
-
-```bash
-railway new node my-node          # ハイフン不可 → my_node を提案
-railway new node class             # Python予約語
-railway new node greeting/farewell # スラッシュ不可 → greeting.farewell を提案
-```
-
----
-
-## Step 6: エラーハンドリング（3分）
-
-### 6.1 失敗パスの追加
-
-遷移グラフに失敗パスを追加:
-
-```yaml
-nodes:
-  exit:
-    failure:
-      error:
-        description: "エラー終了"
-
-transitions:
-  check_time:
-    success::morning: greet_morning
-    success::afternoon: greet_afternoon
-    success::evening: greet_evening
-    failure::error: exit.failure.error
-```
-
-### 6.2 ノードでのエラーハンドリング
-
-```python
-@node
-def check_time(board) -> Outcome:
-    \"\"\"時間帯を判定\"\"\"
-    try:
-        hour = datetime.now().hour
-        if 5 <= hour < 12:
-            board.period = "morning"
-            return Outcome.success("morning")
-        elif 12 <= hour < 18:
-            board.period = "afternoon"
-            return Outcome.success("afternoon")
-        else:
-            board.period = "evening"
-            return Outcome.success("evening")
-    except Exception:
-        board.error = "時間帯の判定に失敗"
-        return Outcome.failure("error")
-```
-
-**ポイント:**
-- 想定内のエラーは `Outcome.failure()` で表現
-- 遷移グラフで適切な終端ノードへルーティング
-- 例外は「プログラムのバグ」として伝播（try-except は最小限に）
-
----
-
-## Step 7: ステップコールバック（3分）
-
-### 7.1 StepRecorder で実行履歴を記録
-
-```python
-from railway.core.dag import dag_runner, StepRecorder
-
-recorder = StepRecorder()
-
-result = dag_runner(
-    start=check_time,
-    transitions=TRANSITIONS,
-    on_step=recorder,
-)
-
-# 実行履歴を確認
-for step in recorder.get_history():
-    print(f"[{{step.node_name}}] -> {{step.state}}")
-```
-
-### 7.2 AuditLogger で監査ログ
-
-```python
-from railway.core.dag import AuditLogger
-
-audit = AuditLogger(workflow_id="incident-123")
-
-result = dag_runner(
-    start=check_time,
-    transitions=TRANSITIONS,
-    on_step=audit,
-)
-```
-
----
-
-## Step 8: バージョン管理（3分）
-
-### 8.1 現状を確認
-
-```bash
-cat .railway/project.yaml
-```
-
-### 8.2 更新
-
-```bash
-# プレビュー
-railway update --dry-run
-
-# 実行
-railway update
-```
-
-### 8.3 バックアップから復元
-
-```bash
-railway backup list
-railway backup restore
-```
-
----
-
-## Step 9: 既存プロジェクトのアップグレード（3分）
-
-旧バージョンのプロジェクトを最新形式にアップグレードする方法を学びます。
-
-### 9.1 変更内容をプレビュー
-
-```bash
-railway update --dry-run
-```
-
-**出力例:**
-```
-マイグレーション: 0.13.x → 0.14.0
-
-コードガイダンス:
-  src/nodes/process.py:5
-    現在: def process(ctx: ProcessContext) -> tuple[ProcessContext, Outcome]:
-    推奨: def process(board) -> Outcome:
-```
-
-### 9.2 アップグレード実行
-
-```bash
-railway update
-```
-
-### 9.3 コードを修正
-
-ガイダンスに従って、旧形式のノードを新形式に変更します。
-
-**Before:**
-```python
-@node
-def process(data: dict) -> dict:
-    return data
-```
-
-**After:**
-```python
-@node
-def process(board) -> Outcome:
-    board.result = "processed"
-    return Outcome.success("done")
-```
-
-**恩恵:**
-- Outcome で次の遷移先を制御できる
-- Board で簡潔にデータを扱える（Contract 定義不要）
-- YAML で遷移ロジックを可視化できる
-
----
-
-## Step 10: Trace モードで実行
-
-ノードごとの Board 変更を確認できます:
-
-```bash
-railway run greeting --trace
-```
-
-出力例:
-
-```
-Trace mode enabled
-Running entry point: greeting
-... (ログ出力)
-[trace] check_time: mutations: period
-[trace] greet_morning: mutations: greeting
-✓ 完了 (exit_state=success.done)
-```
-
-各ノードがどのフィールドを変更したかが一目でわかります。
-デバッグ時に特に便利です。
-
-#### プログラムからの利用
-
-```python
-result = run(trace=True)
-if result.trace:
-    for node_trace in result.trace.traces:
-        print(f"{{node_trace.node_name}}: {{node_trace.mutations}}")
-```
-
----
-
-## ポイントまとめ
-
-1. **ノードは状態を返すだけ** - 遷移先はYAMLで定義
-2. **Outcome を使う** - `Outcome.success("done")` で簡潔に
-3. **Board を使う** - `board.xxx` でデータを読み書き
-4. **YAMLを変更したら再sync** - `railway sync transition --entry <name>`
-5. **Trace で可視化** - `railway run <name> --trace` でデバッグ
-
----
-
-## 次のステップ
-
-### 学んだこと
-
-- dag_runner による条件分岐ワークフロー
-- Board パターンによるデータ共有
-- Outcome クラスによる状態返却
-- 遷移グラフ（YAML）の定義
-- コード生成
-- Trace モードによるデバッグ
-- ステップコールバック
-- バージョン管理とアップグレード
-
-### さらに学ぶ
-
-- `railway docs` でフレームワークのドキュメントを表示
-- `railway docs --browser` でブラウザでドキュメントを開く
-
----
-
-## チャレンジ
-
-1. 週末と平日で挨拶を変える分岐を追加
-2. 複数の終端ノード（exit.success.done, exit.failure.error）を使い分け
-3. CompositeCallback を使って複数のコールバックを組み合わせ
-
----
-
-## トラブルシューティング
-
-### mypy で型チェックが効かない場合
+        project_name: プロジェクト名
 
-```bash
-uv sync --reinstall-package railway-framework
-rm -rf .mypy_cache/
-uv run mypy src/
-```
+    Returns:
+        TUTORIAL.md のテンプレート文字列
+    """
+    return _tutorial_template().substitute(project_name=project_name)
 
-### テストが失敗する場合
 
-```bash
-rm -rf .pytest_cache/ __pycache__/
-uv sync
-```
-'''
+@lru_cache(maxsize=1)
+def _tutorial_fragments() -> _SplitTemplate:
+    """TUTORIAL.md template pre-split by _split_template, built on first use."""
+    return _split_template(_tutorial_template())
 
 
 def _create_tutorial_md(project_path: Path, project_name: str) -> None:
     """Create TUTORIAL.md file with dag_runner Board mode as default."""
-    content = _get_tutorial_content(project_name)
-    _write_file(project_path / "TUTORIAL.md", content)
-
+    _write_template(
+        os.path.join(project_path, "TUTORIAL.md"),
+        _tutorial_fragments(),
+        project_name=project_name,
+    )
 
 
-def _create_gitignore(project_path: Path) -> None:
-    """Create .gitignore file."""
-    content = '''# Python
+_GITIGNORE_CONTENT: bytes = b'''# Python
 __pycache__/
 *.py[cod]
 *.so
@@ -931,12 +366,14 @@ htmlcov/
 _railway/generated/*.py
 !_railway/generated/.gitkeep
 '''
-    _write_file(project_path / ".gitignore", content)
 
 
-def _get_sample_transition_yaml() -> str:
-    """Get sample transition graph YAML content."""
-    return '''version: "1.0"
+def _create_gitignore(project_path: Path, kept: list[str] | None = None) -> None:
+    """Create .gitignore file; with ``kept``, an existing one is kept."""
+    _write_file(os.path.join(project_path, ".gitignore"), _GITIGNORE_CONTENT, kept)
+
+
+_SAMPLE_TRANSITION_YAML = '''version: "1.0"
 entrypoint: hello
 description: "サンプルワークフロー"
 
@@ -966,28 +403,32 @@ options:
 '''
 
 
+def _get_sample_transition_yaml() -> str:
+    """Get sample transition graph YAML content."""
+    return _SAMPLE_TRANSITION_YAML
+
+
 def _create_dag_directories(project_path: Path) -> None:
     """Create DAG workflow directories and files."""
-    # Create transition_graphs directory
-    graphs_dir = project_path / "transition_graphs"
-    graphs_dir.mkdir(parents=True, exist_ok=True)
-    (graphs_dir / ".gitkeep").write_text(
+    # transition_graphs/ and _railway/generated/ are created up front
+    # by _create_project_structure.
+    graphs_dir = os.path.join(project_path, "transition_graphs")
+    _write_file(
+        os.path.join(graphs_dir, ".gitkeep"),
         "# Transition graph YAML files\n"
-        "# File naming: {entrypoint}_{YYYYMMDDHHmmss}.yml\n"
+        "# File naming: {entrypoint}_{YYYYMMDDHHmmss}.yml\n",
     )
 
-    # Create _railway/generated directory
-    generated_dir = project_path / "_railway" / "generated"
-    generated_dir.mkdir(parents=True, exist_ok=True)
-    (generated_dir / ".gitkeep").write_text(
+    _write_file(
+        os.path.join(project_path, "_railway", "generated", ".gitkeep"),
         "# Auto-generated transition code\n"
-        "# Do not edit manually - use `railway sync transition`\n"
+        "# Do not edit manually - use `railway sync transition`\n",
     )
 
     # Create sample YAML with timestamp
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     sample_yaml = _get_sample_transition_yaml()
-    (graphs_dir / f"hello_{timestamp}.yml").write_text(sample_yaml)
+    _write_file(os.path.join(graphs_dir, f"hello_{timestamp}.yml"), sample_yaml)
 
 
 def _get_py_typed_paths(project_path: Path) -> tuple[Path, ...]:
@@ -1003,10 +444,11 @@ def _get_py_typed_paths(project_path: Path) -> tuple[Path, ...]:
         mypy はサブパッケージにも py.typed が必要なため、
         src/, src/nodes/, src/contracts/ に配置する。
     """
+    src = project_path / "src"
     return (
-        project_path / "src" / "py.typed",
-        project_path / "src" / "nodes" / "py.typed",
-        project_path / "src" / "contracts" / "py.typed",
+        src / "py.typed",
+        src.joinpath("nodes", "py.typed"),
+        src.joinpath("contracts", "py.typed"),
     )
 
 
@@ -1022,30 +464,25 @@ def _create_py_typed(project_path: Path) -> None:
     the user's project as a typed package.
     """
     for path in _get_py_typed_paths(project_path):
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.touch()  # 空ファイル（PEP 561 準拠）
+        _write_file(str(path), b"")  # 空ファイル（PEP 561 準拠）
 
 
 def _create_init_files(project_path: Path) -> None:
     """Create __init__.py files."""
+    src = os.path.join(project_path, "src")
+    tests = os.path.join(project_path, "tests")
     init_files = [
-        (project_path / "src" / "__init__.py", '"""Source package."""\n'),
-        (project_path / "src" / "nodes" / "__init__.py", '"""Node modules."""\n'),
-        (project_path / "src" / "common" / "__init__.py", '"""Common utilities."""\n'),
-        (project_path / "tests" / "__init__.py", ""),
-        (project_path / "tests" / "nodes" / "__init__.py", ""),
+        (os.path.join(src, "__init__.py"), b'"""Source package."""\n'),
+        (os.path.join(src, "nodes", "__init__.py"), b'"""Node modules."""\n'),
+        (os.path.join(src, "common", "__init__.py"), b'"""Common utilities."""\n'),
+        (os.path.join(tests, "__init__.py"), b""),
+        (os.path.join(tests, "nodes", "__init__.py"), b""),
     ]
     for path, content in init_files:
         _write_file(path, content)
 
 
-def _create_conftest_py(project_path: Path) -> None:
-    """Create tests/conftest.py file with proper path setup.
-
-    src/ を sys.path に追加することで、テストから
-    src. プレフィックスなしでモジュールをインポート可能にする。
-    """
-    content = '''"""Pytest configuration and shared fixtures."""
+_CONFTEST_PY_CONTENT: bytes = '''"""Pytest configuration and shared fixtures."""
 
 import sys
 from pathlib import Path
@@ -1071,17 +508,20 @@ def sample_user_data() -> dict:
 def empty_data() -> dict:
     """空のデータを提供するフィクスチャ"""
     return {}
-'''
-    _write_file(project_path / "tests" / "conftest.py", content)
+'''.encode()
 
 
-def _create_simple_hello_entry(project_path: Path) -> None:
-    """Create minimal hello.py for immediate verification.
+def _create_conftest_py(project_path: Path, kept: list[str] | None = None) -> None:
+    """Create tests/conftest.py file with proper path setup.
 
-    This simple entry point allows users to verify their setup works
-    immediately after `railway init` without any additional steps.
+    src/ を sys.path に追加することで、テストから
+    src. プレフィックスなしでモジュールをインポート可能にする。
+    With ``kept``, an existing conftest.py is kept.
     """
-    content = '''"""Hello World entry point - セットアップ確認用."""
+    _write_file(os.path.join(project_path, "tests", "conftest.py"), _CONFTEST_PY_CONTENT, kept)
+
+
+_SIMPLE_HELLO_CONTENT: bytes = '''"""Hello World entry point - セットアップ確認用."""
 
 from railway import entry_point
 
@@ -1099,13 +539,19 @@ def hello():
 
 if __name__ == "__main__":
     hello._typer_app()  # type: ignore[union-attr]
-'''
-    _write_file(project_path / "src" / "hello.py", content)
+'''.encode()
 
 
-def _create_example_entry(project_path: Path) -> None:
-    """Create complex example entry point with pipeline demonstration."""
-    content = '''"""Hello World entry point with pipeline example."""
+def _create_simple_hello_entry(project_path: Path) -> None:
+    """Create minimal hello.py for immediate verification.
+
+    This simple entry point allows users to verify their setup works
+    immediately after `railway init` without any additional steps.
+    """
+    _write_file(os.path.join(project_path, "src", "hello.py"), _SIMPLE_HELLO_CONTENT)
+
+
+_EXAMPLE_ENTRY_CONTENT: bytes = '''"""Hello World entry point with pipeline example."""
 
 from railway import entry_point, node, pipeline
 
@@ -1146,8 +592,60 @@ def hello(name: str = "World"):
 
 if __name__ == "__main__":
     hello._typer_app()  # type: ignore[union-attr]
-'''
-    _write_file(project_path / "src" / "hello.py", content)
+'''.encode()
+
+
+def _create_example_entry(project_path: Path) -> None:
+    """Create complex example entry point with pipeline demonstration."""
+    _write_file(os.path.join(project_path, "src", "hello.py"), _EXAMPLE_ENTRY_CONTENT)
+
+
+# Below this many tasks a thread pool costs more than it overlaps.
+_MIN_PARALLEL_TASKS: int = 4
+
+
+def _run_file_tasks(
+    tasks: list[tuple[Callable[..., None], tuple[Any, ...]]],
+    jobs: int,
+) -> None:
+    """Run file-creation tasks on up to ``jobs`` worker threads.
+
+    Batches smaller than ``_MIN_PARALLEL_TASKS`` (or ``jobs <= 1``) run
+    sequentially in the calling thread, where pool startup would cost more
+    than it saves. The first task exception is re-raised after all tasks
+    are submitted.
+    """
+    workers = min(jobs, len(tasks))
+    if workers <= 1 or len(tasks) < _MIN_PARALLEL_TASKS:
+        for func, args in tasks:
+            func(*args)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, *args) for func, args in tasks]
+        for future in futures:
+            future.result()
+
+
+def _create_directories(project_path: Path) -> None:
+    """Create the project root and every directory in _PROJECT_DIRECTORIES.
+
+    Directories are created parents first, so no ancestor is probed
+    recursively. Where supported, each mkdir is resolved against one
+    open fd of the project root instead of the full path.
+    """
+    os.makedirs(project_path, exist_ok=True)
+    if os.mkdir not in os.supports_dir_fd:
+        for relative in _PROJECT_DIRECTORIES:
+            with suppress(FileExistsError):
+                os.mkdir(os.path.join(project_path, relative))
+        return
+    root_fd = os.open(project_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for relative in _PROJECT_DIRECTORIES:
+            with suppress(FileExistsError):
+                os.mkdir(relative, dir_fd=root_fd)
+    finally:
+        os.close(root_fd)
 
 
 def _create_project_structure(
@@ -1155,73 +653,100 @@ def _create_project_structure(
     project_name: str,
     python_version: str,
     with_examples: bool,
+    jobs: int = 4,
+    kept: list[str] | None = None,
 ) -> None:
-    """Create all project directories and files."""
-    # Create directories (functional approach with map)
-    directories = [
-        project_path / "src" / "nodes",
-        project_path / "src" / "common",
-        project_path / "tests" / "nodes",
-        project_path / "config",
-        project_path / "logs",
-    ]
-    list(map(_create_directory, directories))
-
-    # Create files (using pure functions)
-    _create_pyproject_toml(project_path, project_name, python_version)
-    _create_env_example(project_path, project_name)
-    _create_development_yaml(project_path, project_name)
-    _create_settings_py(project_path)
-    _create_tutorial_md(project_path, project_name)
-    _create_gitignore(project_path)
-    _create_init_files(project_path)
-    _create_conftest_py(project_path)
-    _create_py_typed(project_path)
+    """Create all project directories and files.
+
+    Directories are created first; the independent file writes are then
+    spread across ``jobs`` worker threads. When ``kept`` is given
+    (init --existing-ok), an existing .gitignore or tests/conftest.py is
+    left untouched and its path collected in ``kept``.
+    """
+    _create_directories(project_path)
 
     # Create hello entry point
     # Default: simple hello.py for immediate verification
     # --with-examples: complex pipeline example
-    if with_examples:
-        _create_example_entry(project_path)
-    else:
-        _create_simple_hello_entry(project_path)
-
-    # Create DAG workflow directories
-    _create_dag_directories(project_path)
+    create_hello = _create_example_entry if with_examples else _create_simple_hello_entry
+
+    # Each task writes distinct files into the directories created above,
+    # so they can run concurrently.
+    file_tasks: list[tuple[Callable[..., None], tuple[Any, ...]]] = [
+        (_create_pyproject_toml, (project_path, project_name, python_version)),
+        (_create_env_example, (project_path, project_name)),
+        (_create_development_yaml, (project_path, project_name)),
+        (_create_settings_py, (project_path,)),
+        (_create_tutorial_md, (project_path, project_name)),
+        (_create_gitignore, (project_path, kept)),
+        (_create_init_files, (project_path,)),
+        (_create_conftest_py, (project_path, kept)),
+        (_create_py_typed, (project_path,)),
+        (create_hello, (project_path,)),
+        # DAG workflow files (transition graphs, generated code)
+        (_create_dag_directories, (project_path,)),
+    ]
+    _run_file_tasks(file_tasks, jobs)
 
     # Create .railway/project.yaml with version metadata
+    # (imported here so other CLI commands do not pay for PyYAML/pydantic models)
+    from railway import __version__
+    from railway.core.project_metadata import create_metadata, save_metadata
+
     metadata = create_metadata(project_name, __version__)
     save_metadata(project_path, metadata)
 
 
 def _show_success_output(project_name: str) -> None:
     """Display success message and next steps."""
-    typer.echo(f"\nCreated project: {project_name}\n")
-    typer.echo("Project structure:")
-    typer.echo(f"  {project_name}/")
-    typer.echo("  ├── .railway/")
-    typer.echo("  │   └── project.yaml")
-    typer.echo("  ├── _railway/")
-    typer.echo("  │   └── generated/")
-    typer.echo("  ├── transition_graphs/")
-    typer.echo("  │   └── hello_*.yml")
-    typer.echo("  ├── src/")
-    typer.echo("  ├── tests/")
-    typer.echo("  ├── config/")
-    typer.echo("  ├── .env.example")
-    typer.echo("  └── TUTORIAL.md\n")
-    typer.echo("Next steps:")
-    typer.echo(f"  1. cd {project_name}")
-    typer.echo("  2. uv sync --group dev")
-    typer.echo("  3. cp .env.example .env")
-    typer.echo("  4. uv run railway run hello  # 動作確認")
-    typer.echo("  5. Open TUTORIAL.md and follow the guide")
+    typer.echo(
+        f"""
+Created project: {project_name}
+
+Project structure:
+  {project_name}/
+  ├── .railway/
+  │   └── project.yaml
+  ├── _railway/
+  │   └── generated/
+  ├── transition_graphs/
+  │   └── hello_*.yml
+  ├── src/
+  ├── tests/
+  ├── config/
+  ├── .env.example
+  └── TUTORIAL.md
+
+Next steps:
+  1. cd {project_name}
+  2. uv sync --group dev
+  3. cp .env.example .env
+  4. uv run railway run hello  # 動作確認
+  5. Open TUTORIAL.md and follow the guide"""
+    )
+
+
+def _show_kept_files(project_dir: str, kept: list[str]) -> None:
+    """List the existing files that init --existing-ok left untouched."""
+    typer.echo("\nKept existing files (not overwritten):")
+    for path in sorted(os.path.relpath(path, project_dir) for path in kept):
+        typer.echo(f"  {path}")
 
 
 def init(
-    project_name: str = typer.Argument(..., help="Name of the project to create"),
-    python_version: str = typer.Option("3.10", help="Minimum Python version"),
-    with_examples: bool = typer.Option(False, help="Include example entry points"),
+    project_name: Annotated[str, typer.Argument(help="Name of the project to create")],
+    python_version: Annotated[str, typer.Option(help="Minimum Python version")] = "3.10",
+    with_examples: Annotated[bool, typer.Option(help="Include example entry points")] = False,
+    jobs: Annotated[
+        int, typer.Option("--jobs", "-j", min=1, help="Number of parallel file writes")
+    ] = 4,
+    existing_ok: Annotated[
+        bool,
+        typer.Option(
+            "--existing-ok",
+            help="Scaffold into an existing directory (keeps .gitignore and tests/conftest.py)",
+        ),
+    ] = False,
 ) -> None:
     """
     Create a new Railway Framework project.
@@ -1232,14 +757,30 @@ def init(
     # Validate project name
     normalized_name = _validate_project_name(project_name)
 
-    # Check if directory exists
-    project_path = Path.cwd() / normalized_name
-    if project_path.exists():
+    # Check if directory exists (a single lstat on a plain string path, so a
+    # dangling symlink also counts; a Path is only built once the check passes)
+    project_dir = os.path.join(os.getcwd(), normalized_name)
+    exists = os.path.lexists(project_dir)
+    if exists and not existing_ok:
         typer.echo(f"Error: Directory '{normalized_name}' already exists", err=True)
         raise typer.Exit(1)
+    if exists and not os.path.isdir(project_dir):
+        typer.echo(f"Error: '{normalized_name}' exists and is not a directory", err=True)
+        raise typer.Exit(1)
 
-    # Create directory structure
-    _create_project_structure(project_path, normalized_name, python_version, with_examples)
+    # Create directory structure; a failed scaffold of a new project is
+    # removed rather than left half-written (an existing directory is kept)
+    kept: list[str] | None = [] if exists else None
+    try:
+        _create_project_structure(
+            Path(project_dir), normalized_name, python_version, with_examples, jobs, kept
+        )
+    except BaseException:
+        if not exists:
+            shutil.rmtree(project_dir, ignore_errors=True)
+        raise
 
     # Show success message
     _show_success_output(normalized_name)
+    if kept:
+        _show_kept_files(project_dir, kept)
@@ -1,34 +1,89 @@
 """railway list command implementation."""
 
 import ast
-from pathlib import Path
+import os
+import re
 from typing import Any
 
 import typer
 
+# Leading comment/blank lines, then a triple-quoted string that is the
+# whole first statement (only whitespace or a comment may follow it).
+_DOCSTRING_PATTERN = re.compile(
+    r"""(?:[ \t\f]*(?:#[^\n]*)?\n)*("{3}|'{3})(.*?)\1[ \t\f]*(?:#[^\n]*)?(?:\n|\Z)""",
+    re.DOTALL,
+)
 
-def _is_railway_project() -> bool:
+# Modules in src/ that are never entry points
+_SKIP_ENTRY_FILES: frozenset[str] = frozenset({"__init__.py", "settings.py"})
+
+
+def _is_railway_project(cwd: str) -> bool:
     """Check if current directory is a Railway project."""
-    return (Path.cwd() / "src").exists()
+    return os.path.isdir(os.path.join(cwd, "src"))
 
 
 def _extract_module_docstring(content: str) -> str | None:
     """Extract module docstring from Python code."""
-    try:
-        tree = ast.parse(content)
-        docstring = ast.get_docstring(tree)
-        if docstring:
-            # Return first line only
-            return docstring.split("\n")[0].strip()
+    docstring = _match_module_docstring(content)
+    if docstring is None:
+        try:
+            docstring = ast.get_docstring(ast.parse(content))
+        except Exception:
+            return None
+    if docstring:
+        # Return first line only
+        return docstring.split("\n")[0].strip()
+    return None
+
+
+def _match_module_docstring(content: str) -> str | None:
+    """Extract a plain triple-quoted module docstring without parsing.
+
+    Handles the common layout (optional comment/blank lines, then an
+    unprefixed triple-quoted string alone on its line) and returns the
+    docstring cleaned as ast.get_docstring would. Returns None for
+    anything else (escapes, prefixes, CRLF, a longer closing quote run,
+    other statements first) so the caller falls back to ast.parse.
+
+    Only the docstring itself is checked: the rest of the file is not
+    parsed, so a syntax error after the docstring does not hide it.
+    """
+    match = _DOCSTRING_PATTERN.match(content)
+    if match is None:
         return None
-    except Exception:
+    quote, body = match.groups()
+    if quote in body or "\\" in body or "\r" in body or body.endswith(quote[0]):
         return None
+    import inspect
+
+    return inspect.cleandoc(body)
+
 
+def _read_source(file_path: str) -> str:
+    """Read a source file as UTF-8 with a single open/fstat/read/close.
 
-def _analyze_entry_file(file_path: Path) -> dict[str, Any] | None:
+    Skips the buffered text layer of Path.read_text; newlines are left
+    as-is, which both the substring checks and ast.parse accept.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _analyze_entry_file(name: str, file_path: str, relative_path: str) -> dict[str, Any] | None:
     """Analyze a Python file for @entry_point decorator."""
     try:
-        content = file_path.read_text()
+        content = _read_source(file_path)
 
         # Check for @entry_point decorator
         if "@entry_point" not in content:
@@ -38,18 +93,18 @@ def _analyze_entry_file(file_path: Path) -> dict[str, Any] | None:
         docstring = _extract_module_docstring(content)
 
         return {
-            "name": file_path.stem,
-            "path": str(file_path.relative_to(Path.cwd())),
+            "name": name,
+            "path": relative_path,
             "description": docstring or "No description",
         }
     except Exception:
         return None
 
 
-def _analyze_node_file(file_path: Path) -> dict[str, Any] | None:
+def _analyze_node_file(name: str, file_path: str, relative_path: str) -> dict[str, Any] | None:
     """Analyze a Python file for @node decorator."""
     try:
-        content = file_path.read_text()
+        content = _read_source(file_path)
 
         # Check for @node decorator
         if "@node" not in content:
@@ -59,19 +114,19 @@ def _analyze_node_file(file_path: Path) -> dict[str, Any] | None:
         docstring = _extract_module_docstring(content)
 
         return {
-            "name": file_path.stem,
-            "path": str(file_path.relative_to(Path.cwd())),
+            "name": name,
+            "path": relative_path,
             "description": docstring or "No description",
         }
     except Exception:
         return None
 
 
-def _analyze_contract_file(file_path: Path) -> list[dict[str, Any]]:
+def _analyze_contract_file(file_path: str, relative_path: str) -> list[dict[str, Any]]:
     """Analyze a Python file for Contract/Params classes."""
     results = []
     try:
-        content = file_path.read_text()
+        content = _read_source(file_path)
         tree = ast.parse(content)
 
         for node in ast.walk(tree):
@@ -88,7 +143,7 @@ def _analyze_contract_file(file_path: Path) -> list[dict[str, Any]]:
                         docstring = ast.get_docstring(node)
                         results.append({
                             "name": node.name,
-                            "path": str(file_path.relative_to(Path.cwd())),
+                            "path": relative_path,
                             "type": base_name,
                             "description": (docstring.split("\n")[0].strip() if docstring else "No description"),
                         })
@@ -99,53 +154,59 @@ def _analyze_contract_file(file_path: Path) -> list[dict[str, Any]]:
         return []
 
 
-def _find_entries() -> list[dict[str, Any]]:
-    """Find all entry points in src/."""
-    src_dir = Path.cwd() / "src"
-    skip_files = {"__init__.py", "settings.py"}
+def _scan_py_files(cwd: str, relative_dir: str) -> list[tuple[str, str, str]]:
+    """List the public ``*.py`` files directly in ``cwd/relative_dir``.
 
-    def should_analyze(py_file: Path) -> bool:
-        return not py_file.name.startswith("_") and py_file.name not in skip_files
+    One os.scandir pass; a missing directory yields no files. Each file is
+    returned as plain strings ``(file_name, path, relative_path)`` built
+    from the known root, so callers need no Path operations.
+    """
+    directory = os.path.join(cwd, relative_dir)
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_")
+            ]
+    except OSError:
+        return []
+    return [
+        (name, os.path.join(directory, name), os.path.join(relative_dir, name))
+        for name in names
+    ]
 
-    files = [f for f in src_dir.glob("*.py") if should_analyze(f)]
-    entries = [_analyze_entry_file(f) for f in files]
+
+def _find_entries(cwd: str) -> list[dict[str, Any]]:
+    """Find all entry points in src/."""
+    entries = (
+        _analyze_entry_file(name[:-3], path, relative_path)
+        for name, path, relative_path in _scan_py_files(cwd, "src")
+        if name not in _SKIP_ENTRY_FILES
+    )
     return [e for e in entries if e is not None]
 
 
-def _find_nodes() -> list[dict[str, Any]]:
+def _find_nodes(cwd: str) -> list[dict[str, Any]]:
     """Find all nodes in src/nodes/."""
-    nodes_dir = Path.cwd() / "src" / "nodes"
-
-    if not nodes_dir.exists():
-        return []
-
-    def should_analyze(py_file: Path) -> bool:
-        return not py_file.name.startswith("_")
-
-    files = [f for f in nodes_dir.glob("*.py") if should_analyze(f)]
-    nodes = [_analyze_node_file(f) for f in files]
+    nodes = (
+        _analyze_node_file(name[:-3], path, relative_path)
+        for name, path, relative_path in _scan_py_files(cwd, os.path.join("src", "nodes"))
+    )
     return [n for n in nodes if n is not None]
 
 
-def _find_contracts() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+def _find_contracts(cwd: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Find all contracts in src/contracts/.
 
     Returns:
         Tuple of (contracts, params) lists.
     """
-    contracts_dir = Path.cwd() / "src" / "contracts"
-
-    if not contracts_dir.exists():
-        return [], []
-
     contracts = []
     params = []
 
-    for py_file in contracts_dir.glob("*.py"):
-        if py_file.name.startswith("_"):
-            continue
-
-        for info in _analyze_contract_file(py_file):
+    for _, path, relative_path in _scan_py_files(cwd, os.path.join("src", "contracts")):
+        for info in _analyze_contract_file(path, relative_path):
             if info["type"] == "Params":
                 params.append(info)
             else:
@@ -154,13 +215,24 @@ def _find_contracts() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     return contracts, params
 
 
-def _count_tests() -> int:
+def _count_tests(cwd: str) -> int:
     """Count test files."""
-    tests_dir = Path.cwd() / "tests"
-    if not tests_dir.exists():
-        return 0
-
-    return sum(1 for _ in tests_dir.rglob("test_*.py"))
+    # Iterative os.scandir walk matching rglob("test_*.py"): symlinked
+    # directories are not followed and unreadable ones are skipped.
+    count = 0
+    pending = [os.path.join(cwd, "tests")]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("test_") and name.endswith(".py"):
+                        count += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return count
 
 
 def _display_entries(entries: list[dict[str, Any]]) -> None:
@@ -223,23 +295,23 @@ def list_components(
         railway list nodes     # Show only nodes
         railway list contracts # Show only contracts
     """
+    # Resolved once; every scan and relative path below is based on it
+    cwd = os.getcwd()
+
     if filter_type == "contracts":
         # For contracts, we don't require src/ (might list from registry)
-        contracts, params = _find_contracts()
+        contracts, params = _find_contracts(cwd)
         _display_contracts(contracts, params)
         return
 
-    if not _is_railway_project():
+    if not _is_railway_project(cwd):
         typer.echo("Error: Not in a Railway project (src/ directory not found)", err=True)
         raise typer.Exit(1)
 
-    entries = _find_entries()
-    nodes = _find_nodes()
-    tests = _count_tests()
-
+    # Only scan what the selected view displays
     if filter_type == "entries":
-        _display_entries(entries)
+        _display_entries(_find_entries(cwd))
     elif filter_type == "nodes":
-        _display_nodes(nodes)
+        _display_nodes(_find_nodes(cwd))
     else:
-        _display_all(entries, nodes, tests)
+        _display_all(_find_entries(cwd), _find_nodes(cwd), _count_tests(cwd))
@@ -1,23 +1,60 @@
 """Main CLI entry point for Railway Framework."""
 
+from functools import cache
+from importlib import import_module
+from typing import Any
 
 import typer
+from typer.core import TyperGroup
 
-from railway import __version__
-from railway.cli.backup import app as backup_app
-from railway.cli.docs import docs
-from railway.cli.init import init
-from railway.cli.list import list_components
-from railway.cli.new import new
-from railway.cli.run import run
-from railway.cli.show import show
-from railway.cli.sync import app as sync_app
-from railway.cli.update import app as update_app
+# Subcommands in help order: name -> (module, attribute). Each module is
+# imported only when its command is dispatched or listed in --help.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "init": ("railway.cli.init", "init"),
+    "new": ("railway.cli.new", "new"),
+    "list": ("railway.cli.list", "list_components"),
+    "run": ("railway.cli.run", "run"),
+    "docs": ("railway.cli.docs", "docs"),
+    "show": ("railway.cli.show", "show"),
+    "update": ("railway.cli.update", "app"),
+    "backup": ("railway.cli.backup", "app"),
+    "sync": ("railway.cli.sync", "app"),
+}
+
+
+# click objects are typed as Any: newer typer releases vendor click instead
+# of depending on it, so there is no single importable click to annotate with.
+@cache
+def _load_command(name: str) -> Any:
+    """Import a subcommand and convert it to a click command."""
+    module_name, attribute = _LAZY_COMMANDS[name]
+    target = getattr(import_module(module_name), attribute)
+    holder = typer.Typer()
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name)
+    else:
+        holder.command(name=name)(target)
+    return typer.main.get_group(holder).commands[name]
+
+
+class _LazyCommandGroup(TyperGroup):
+    """Typer group that resolves registered subcommands on first use."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return [*super().list_commands(ctx), *_LAZY_COMMANDS]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name in _LAZY_COMMANDS:
+            return _load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
 def version_callback(value: bool) -> None:
     """Display version and exit."""
     if value:
+        # Imported here so only --version reads the installed package metadata
+        from railway import __version__
+
         typer.echo(f"railway {__version__}")
         raise typer.Exit()
 
@@ -26,6 +63,7 @@ app = typer.Typer(
     name="railway",
     help="Railway Framework CLI - Build robust Python automation",
     add_completion=False,
+    cls=_LazyCommandGroup,
 )
 
 
@@ -44,17 +82,5 @@ def main(
     pass
 
 
-# Register commands
-app.command(name="init")(init)
-app.command(name="new")(new)
-app.command(name="list")(list_components)
-app.command(name="run")(run)
-app.command(name="docs")(docs)
-app.command(name="show")(show)
-app.add_typer(update_app, name="update")
-app.add_typer(backup_app, name="backup")
-app.add_typer(sync_app, name="sync")
-
-
 if __name__ == "__main__":
     app()
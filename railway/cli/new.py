@@ -1,18 +1,25 @@
 """railway new command implementation."""
 
+import os
 import re
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import TYPE_CHECKING
 
 import typer
 
+from railway.cli._fs import WRITE_FLAGS, open_and_write, write_new_file
 from railway.core.dag.validator import validate_entry_name, validate_node_name
 
 if TYPE_CHECKING:
     from railway.cli.sync import SyncResult
 
+_CAMEL_WORD_PATTERN = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
+
 
 class ComponentType(str, Enum):
     """Type of component to create."""
@@ -23,20 +30,52 @@ class ComponentType(str, Enum):
 
 
 
-def _is_railway_project() -> bool:
-    """Check if current directory is a Railway project."""
-    return (Path.cwd() / "src").exists()
+def _is_railway_project(cwd: str) -> bool:
+    """Check if the given directory is a Railway project."""
+    return os.path.exists(os.path.join(cwd, "src"))
+
+
+def _write_file(path: str | Path, content: str) -> None:
+    """Write content to a file as UTF-8, replacing any existing content."""
+    open_and_write(path, content.encode(), WRITE_FLAGS)
+
+
+def _overwrite_file(path: str | Path, content: str) -> None:
+    """Write content for --force, skipping files that already match.
+
+    Re-running a scaffold with --force then leaves unchanged files (and
+    their mtimes) alone instead of rewriting identical bytes.
+    """
+    data = content.encode()
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    open_and_write(path, data, WRITE_FLAGS)
 
 
-def _write_file(path: Path, content: str) -> None:
-    """Write content to a file."""
-    path.write_text(content)
+def _create_package_dir(directory: str, init_content: str) -> None:
+    """Create a package directory and its __init__.py unless it already exists."""
+    try:
+        os.makedirs(directory)
+    except FileExistsError:
+        return
+    _write_file(os.path.join(directory, "__init__.py"), init_content)
 
 
+@lru_cache(maxsize=256)
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase to snake_case."""
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _CAMEL_WORD_PATTERN.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_PATTERN.sub(r"\1_\2", s1).lower()
+
+
+@lru_cache(maxsize=256)
+def _snake_to_class(name: str) -> str:
+    """Convert snake_case to a test class name (each word title-cased)."""
+    return "".join(word.title() for word in name.split("_"))
 
 
 # =============================================================================
@@ -87,14 +126,12 @@ def _resolve_exit_module_path(exit_path: str) -> str:
 # =============================================================================
 
 
-def _get_contract_template(name: str) -> str:
-    """Get basic Contract template."""
-    return f'''"""{name} contract."""
+_CONTRACT_TEMPLATE = Template('''"""$name contract."""
 
 from railway import Contract
 
 
-class {name}(Contract):
+class $name(Contract):
     """
     Output contract for a node.
 
@@ -105,36 +142,42 @@ class {name}(Contract):
     # total: int
     # fetched_at: datetime
     pass
-'''
+''')
 
 
-def _get_entity_contract_template(name: str) -> str:
-    """Get entity Contract template."""
-    return f'''"""{name} entity contract."""
+def _get_contract_template(name: str) -> str:
+    """Get basic Contract template."""
+    return _CONTRACT_TEMPLATE.substitute(name=name)
+
+
+_ENTITY_CONTRACT_TEMPLATE = Template('''"""$name entity contract."""
 
 from railway import Contract
 
 
-class {name}(Contract):
+class $name(Contract):
     """
-    Entity contract representing a {name.lower()}.
+    Entity contract representing a $lower_name.
 
     TODO: Define the fields for this entity.
     """
     id: int
     # name: str
     # email: str
-'''
+''')
 
 
-def _get_params_contract_template(name: str) -> str:
-    """Get Params contract template."""
-    return f'''"""{name} parameters."""
+def _get_entity_contract_template(name: str) -> str:
+    """Get entity Contract template."""
+    return _ENTITY_CONTRACT_TEMPLATE.substitute(name=name, lower_name=name.lower())
+
+
+_PARAMS_CONTRACT_TEMPLATE = Template('''"""$name parameters."""
 
 from railway import Params
 
 
-class {name}(Params):
+class $name(Params):
     """
     Parameters for an entry point.
 
@@ -143,7 +186,12 @@ class {name}(Params):
     # user_id: int
     # include_details: bool = False
     pass
-'''
+''')
+
+
+def _get_params_contract_template(name: str) -> str:
+    """Get Params contract template."""
+    return _PARAMS_CONTRACT_TEMPLATE.substitute(name=name)
 
 
 # =============================================================================
@@ -151,6 +199,21 @@ class {name}(Params):
 # =============================================================================
 
 
+def _contract_import_lines(output_type: str, inputs: list[tuple[str, str]]) -> list[str]:
+    """Build contract import lines for the output and input types.
+
+    Duplicates are dropped through an insertion-ordered dict, so the first
+    occurrence keeps its position and each membership check is O(1).
+    """
+    type_names = [output_type, *(type_name for _, type_name in inputs)]
+    return list(
+        dict.fromkeys(
+            f"from contracts.{_camel_to_snake(type_name)} import {type_name}"
+            for type_name in type_names
+        )
+    )
+
+
 def _get_typed_node_template(
     name: str,
     output_type: str,
@@ -158,16 +221,7 @@ def _get_typed_node_template(
 ) -> str:
     """Get typed node template with input/output contracts."""
     # Build imports
-    import_lines = ["from railway import node"]
-    output_snake = _camel_to_snake(output_type)
-    import_lines.append(f"from contracts.{output_snake} import {output_type}")
-
-    for param_name, type_name in inputs:
-        type_snake = _camel_to_snake(type_name)
-        import_line = f"from contracts.{type_snake} import {type_name}"
-        if import_line not in import_lines:
-            import_lines.append(import_line)
-
+    import_lines = ["from railway import node", *_contract_import_lines(output_type, inputs)]
     imports = "\n".join(import_lines)
 
     # Build decorator
@@ -231,19 +285,10 @@ def _get_typed_node_test_template(
     2. Implement the test data
     3. Run tests (pass)
     """
-    class_name = "".join(word.title() for word in name.split("_"))
+    class_name = _snake_to_class(name)
 
     # Build imports
-    import_lines = []
-    output_snake = _camel_to_snake(output_type)
-    import_lines.append(f"from contracts.{output_snake} import {output_type}")
-
-    for param_name, type_name in inputs:
-        type_snake = _camel_to_snake(type_name)
-        import_line = f"from contracts.{type_snake} import {type_name}"
-        if import_line not in import_lines:
-            import_lines.append(import_line)
-
+    import_lines = _contract_import_lines(output_type, inputs)
     import_lines.append(f"from nodes.{name} import {name}")
     imports = "\n".join(import_lines)
 
@@ -296,9 +341,7 @@ class Test{class_name}:
 # =============================================================================
 
 
-def _get_entry_template(name: str) -> str:
-    """Get basic entry point template (legacy - pipeline style)."""
-    return f'''"""{name} entry point."""
+_ENTRY_TEMPLATE = Template('''"""$name entry point."""
 
 from railway import entry_point, node, pipeline
 from loguru import logger
@@ -315,7 +358,7 @@ def process(data: str) -> str:
     Returns:
         Processed data
     """
-    logger.info(f"Processing: {{data}}")
+    logger.info(f"Processing: {data}")
     # TODO: Add implementation
     return data
 
@@ -323,7 +366,7 @@ def process(data: str) -> str:
 @entry_point
 def main(input_data: str = "default"):
     """
-    {name} entry point.
+    $name entry point.
 
     Args:
         input_data: Input data to process
@@ -332,7 +375,7 @@ def main(input_data: str = "default"):
         input_data,
         process,
     )
-    logger.info(f"Result: {{result}}")
+    logger.info(f"Result: {result}")
     return result
 
 
@@ -342,22 +385,23 @@ app = main._typer_app
 
 if __name__ == "__main__":
     main._typer_app()  # type: ignore[union-attr]
-'''
+''')
 
 
-def _get_dag_entry_template(name: str) -> str:
-    """Get Board mode entry point template (sync 後用).
+def _get_entry_template(name: str) -> str:
+    """Get basic entry point template (legacy - pipeline style)."""
+    return _ENTRY_TEMPLATE.substitute(name=name)
 
-    純粋関数: name -> Python コード文字列
 
-    Args:
-        name: エントリーポイント名
+# trace 表示は両テンプレート（sync後/sync前）で同一ロジック
+_TRACE_DISPLAY = '''    # Trace 表示（--trace 指定時のみ result.trace が存在）
+    if hasattr(result, "trace") and result.trace:
+        for nt in result.trace.traces:
+            mutations = ", ".join(nt.mutations) if nt.mutations else "(none)"
+            print(f"[trace] {nt.node_name}: mutations: {mutations}")
+'''
 
-    Returns:
-        Python コード文字列（run() を使用）
-    """
-    # trace 表示は両テンプレート（sync後/sync前）で同一ロジック
-    return f'''"""{name} エントリポイント。"""
+_DAG_ENTRY_TEMPLATE = Template('''"""$name エントリポイント。"""
 import sys
 
 from railway import entry_point
@@ -365,31 +409,26 @@ from railway import entry_point
 
 @entry_point
 def main():
-    from _railway.generated.{name}_transitions import run
+    from _railway.generated.${name}_transitions import run
 
     result = run()
 
-    # Trace 表示（--trace 指定時のみ result.trace が存在）
-    if hasattr(result, "trace") and result.trace:
-        for nt in result.trace.traces:
-            mutations = ", ".join(nt.mutations) if nt.mutations else "(none)"
-            print(f"[trace] {{nt.node_name}}: mutations: {{mutations}}")
-
+''' + _TRACE_DISPLAY + '''
     if result.is_success:
-        print(f"\\u2713 完了 (exit_state={{result.exit_state}})")
+        print(f"\\u2713 完了 (exit_state={result.exit_state})")
     else:
-        print(f"\\u2717 失敗 (exit_state={{result.exit_state}})")
+        print(f"\\u2717 失敗 (exit_state={result.exit_state})")
         sys.exit(result.exit_code)
     return result
 
 
 if __name__ == "__main__":
     main._typer_app()  # type: ignore[union-attr]
-'''
+''')
 
 
-def _get_dag_entry_template_pending_sync(name: str) -> str:
-    """Get Board mode entry point template (sync 前用).
+def _get_dag_entry_template(name: str) -> str:
+    """Get Board mode entry point template (sync 後用).
 
     純粋関数: name -> Python コード文字列
 
@@ -397,25 +436,24 @@ def _get_dag_entry_template_pending_sync(name: str) -> str:
         name: エントリーポイント名
 
     Returns:
-        Python コード文字列（実行可能だが sync を促すメッセージを表示）
-
-    Note:
-        コメントアウトではなく、実行可能なコードを生成する。
-        transitions が見つからない場合は分かりやすいエラーメッセージを表示。
+        Python コード文字列（run() を使用）
     """
-    return f'''"""
-{name} エントリーポイント
+    return _DAG_ENTRY_TEMPLATE.substitute(name=name)
+
+
+_DAG_ENTRY_PENDING_SYNC_TEMPLATE = Template('''"""
+$name エントリーポイント
 
 Usage:
-    railway run {name}
+    railway run $name
     # または
-    python -m src.{name}
+    python -m src.$name
 
 Note:
-    このファイルは `railway new entry {name} --no-sync` で作成されました。
+    このファイルは `railway new entry $name --no-sync` で作成されました。
     実行前に以下のコマンドで遷移コードを生成してください:
 
-        railway sync transition --entry {name}
+        railway sync transition --entry $name
 """
 from railway import entry_point
 
@@ -423,7 +461,7 @@ from railway import entry_point
 def _check_transitions_exist() -> bool:
     """遷移コードが存在するか確認する。"""
     try:
-        from _railway.generated.{name}_transitions import run  # noqa: F401
+        from _railway.generated.${name}_transitions import run  # noqa: F401
         return True
     except ModuleNotFoundError:
         return False
@@ -436,32 +474,45 @@ def main() -> None:
         print("エラー: 遷移コードが見つかりません。")
         print("")
         print("以下のコマンドを実行してください:")
-        print("    railway sync transition --entry {name}")
+        print("    railway sync transition --entry $name")
         print("")
         print("その後、再度実行:")
-        print("    railway run {name}")
+        print("    railway run $name")
         raise SystemExit(1)
 
-    from _railway.generated.{name}_transitions import run
+    from _railway.generated.${name}_transitions import run
 
     result = run()
 
-    # Trace 表示（--trace 指定時のみ result.trace が存在）
-    if hasattr(result, "trace") and result.trace:
-        for nt in result.trace.traces:
-            mutations = ", ".join(nt.mutations) if nt.mutations else "(none)"
-            print(f"[trace] {{nt.node_name}}: mutations: {{mutations}}")
-
+''' + _TRACE_DISPLAY + '''
     if result.is_success:
-        print(f"\\u2713 完了 (exit_state={{result.exit_state}})")
+        print(f"\\u2713 完了 (exit_state={result.exit_state})")
     else:
-        print(f"\\u2717 失敗 (exit_state={{result.exit_state}})")
+        print(f"\\u2717 失敗 (exit_state={result.exit_state})")
     return result
 
 
 if __name__ == "__main__":
     main._typer_app()  # type: ignore[union-attr]
-'''
+''')
+
+
+def _get_dag_entry_template_pending_sync(name: str) -> str:
+    """Get Board mode entry point template (sync 前用).
+
+    純粋関数: name -> Python コード文字列
+
+    Args:
+        name: エントリーポイント名
+
+    Returns:
+        Python コード文字列（実行可能だが sync を促すメッセージを表示）
+
+    Note:
+        コメントアウトではなく、実行可能なコードを生成する。
+        transitions が見つからない場合は分かりやすいエラーメッセージを表示。
+    """
+    return _DAG_ENTRY_PENDING_SYNC_TEMPLATE.substitute(name=name)
 
 
 def _get_dag_node_template(name: str) -> str:
@@ -491,24 +542,13 @@ def start(board) -> Outcome:
 '''
 
 
-def _get_dag_yaml_template(name: str) -> str:
-    """Get transition graph YAML template (v0.13.0+ 新形式).
-
-    純粋関数: name -> YAML テンプレート文字列
-
-    Args:
-        name: エントリーポイント名
-
-    Returns:
-        YAML テンプレート文字列
-    """
-    return f'''version: "1.0"
-entrypoint: {name}
-description: "{name} ワークフロー"
+_DAG_YAML_TEMPLATE = Template('''version: "1.0"
+entrypoint: $name
+description: "$name ワークフロー"
 
 nodes:
   start:
-    module: nodes.{name}.start
+    module: nodes.$name.start
     function: start
     description: "開始ノード"
 
@@ -529,7 +569,21 @@ transitions:
 
 options:
   max_iterations: 100
-'''
+''')
+
+
+def _get_dag_yaml_template(name: str) -> str:
+    """Get transition graph YAML template (v0.13.0+ 新形式).
+
+    純粋関数: name -> YAML テンプレート文字列
+
+    Args:
+        name: エントリーポイント名
+
+    Returns:
+        YAML テンプレート文字列
+    """
+    return _DAG_YAML_TEMPLATE.substitute(name=name)
 
 
 
@@ -587,9 +641,7 @@ def _generate_exit_nodes_from_yaml(
     return sync_exit_nodes(graph, project_root)
 
 
-def _get_entry_example_template(name: str) -> str:
-    """Get example entry point template."""
-    return f'''"""{name} entry point with example implementation."""
+_ENTRY_EXAMPLE_TEMPLATE = Template('''"""$name entry point with example implementation."""
 
 from datetime import datetime
 
@@ -600,28 +652,28 @@ from loguru import logger
 @node
 def fetch_data(date: str) -> dict:
     """Fetch data for the specified date (pure function)."""
-    logger.info(f"Fetching data for {{date}}")
+    logger.info(f"Fetching data for {date}")
     # TODO: Replace with actual API call
-    return {{"date": date, "records": [1, 2, 3]}}
+    return {"date": date, "records": [1, 2, 3]}
 
 
 @node
 def process_data(data: dict) -> dict:
     """Process fetched data (pure function)."""
-    logger.info(f"Processing {{len(data['records'])}} records")
-    return {{
+    logger.info(f"Processing {len(data['records'])} records")
+    return {
         "date": data["date"],
-        "summary": {{
+        "summary": {
             "total": len(data["records"]),
             "sum": sum(data["records"]),
-        }}
-    }}
+        }
+    }
 
 
 @entry_point
 def main(date: str | None = None):
     """
-    {name} entry point.
+    $name entry point.
 
     Args:
         date: Target date (YYYY-MM-DD), defaults to today
@@ -634,7 +686,7 @@ def main(date: str | None = None):
         process_data,
     )
 
-    logger.info(f"Result: {{result}}")
+    logger.info(f"Result: {result}")
     return result
 
 
@@ -644,7 +696,12 @@ app = main._typer_app
 
 if __name__ == "__main__":
     main._typer_app()  # type: ignore[union-attr]
-'''
+''')
+
+
+def _get_entry_example_template(name: str) -> str:
+    """Get example entry point template."""
+    return _ENTRY_EXAMPLE_TEMPLATE.substitute(name=name)
 
 
 # =============================================================================
@@ -652,6 +709,26 @@ if __name__ == "__main__":
 # =============================================================================
 
 
+_DAG_NODE_STANDALONE_TEMPLATE = Template('''"""ノード: $name"""
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def $name(board) -> Outcome:
+    """$name の処理を実行する。
+
+    Args:
+        board: Board（共有状態）
+
+    Returns:
+        Outcome: 処理結果
+    """
+    # TODO: 実装してください
+    return Outcome.success("done")
+''')
+
+
 def _get_dag_node_standalone_template(
     name: str,
     *,
@@ -669,24 +746,30 @@ def _get_dag_node_standalone_template(
         name: 関数名（最終セグメント）
         module_path: import パス（ドット区切り）。省略時は name を使用。
     """
-    return f'''"""ノード: {name}"""
-from railway import node
-from railway.core.dag import Outcome
+    return _DAG_NODE_STANDALONE_TEMPLATE.substitute(name=name)
 
 
-@node
-def {name}(board) -> Outcome:
-    """{name} の処理を実行する。
+_DAG_NODE_CONTEXT_TEMPLATE = Template('''"""${class_name}Context - $effective_name ノードのコンテキスト"""
 
-    Args:
-        board: Board（共有状態）
+from railway import Contract
 
-    Returns:
-        Outcome: 処理結果
+
+class ${class_name}Context(Contract):
     """
-    # TODO: 実装してください
-    return Outcome.success("done")
-'''
+    $effective_name ノードのコンテキスト。
+
+    Contract は不変（イミュータブル）です。
+    更新時は model_copy() を使用してください。
+
+    Example:
+        ctx = ${class_name}Context(value="initial")
+        updated = ctx.model_copy(update={"value": "updated"})
+    """
+    # TODO: 必要なフィールドを定義してください
+    # value: str
+    # processed: bool = False
+    pass
+''')
 
 
 def _get_dag_node_context_template(name: str, *, func_name: str | None = None) -> str:
@@ -700,33 +783,40 @@ def _get_dag_node_context_template(name: str, *, func_name: str | None = None) -
     """
     effective_name = func_name or name
     class_name = _to_pascal_case(effective_name)
-    return f'''"""{class_name}Context - {effective_name} ノードのコンテキスト"""
+    return _DAG_NODE_CONTEXT_TEMPLATE.substitute(
+        class_name=class_name, effective_name=effective_name
+    )
 
-from railway import Contract
 
 
-class {class_name}Context(Contract):
-    """
-    {effective_name} ノードのコンテキスト。
+# =============================================================================
+# Node Test Templates
+# =============================================================================
 
-    Contract は不変（イミュータブル）です。
-    更新時は model_copy() を使用してください。
 
-    Example:
-        ctx = {class_name}Context(value="initial")
-        updated = ctx.model_copy(update={{"value": "updated"}})
-    """
-    # TODO: 必要なフィールドを定義してください
-    # value: str
-    # processed: bool = False
-    pass
-'''
+_DAG_NODE_TEST_STANDALONE_TEMPLATE = Template('''"""Tests for $name node."""
+from railway.core.board import BoardBase
+from railway.core.dag import Outcome
 
+from nodes.$import_path import $name
 
 
-# =============================================================================
-# Node Test Templates
-# =============================================================================
+class Test$class_name:
+    """$name のテスト。
+
+    TDD Workflow:
+    1. Edit this file to define expected behavior
+    2. Run: uv run pytest tests/nodes/test_$name.py -v
+    3. Implement src/nodes/$name.py
+    4. Run tests again
+    """
+
+    def test_success(self) -> None:
+        """正常ケースのテスト。"""
+        board = BoardBase()
+        outcome = $name(board)
+        assert outcome == Outcome.success("done")
+''')
 
 
 def _get_dag_node_test_standalone_template(
@@ -746,29 +836,9 @@ def _get_dag_node_test_standalone_template(
     """
     import_path = module_path or name
     class_name = _to_pascal_case(name)
-    return f'''"""Tests for {name} node."""
-from railway.core.board import BoardBase
-from railway.core.dag import Outcome
-
-from nodes.{import_path} import {name}
-
-
-class Test{class_name}:
-    """{name} のテスト。
-
-    TDD Workflow:
-    1. Edit this file to define expected behavior
-    2. Run: uv run pytest tests/nodes/test_{name}.py -v
-    3. Implement src/nodes/{name}.py
-    4. Run tests again
-    """
-
-    def test_success(self) -> None:
-        """正常ケースのテスト。"""
-        board = BoardBase()
-        outcome = {name}(board)
-        assert outcome == Outcome.success("done")
-'''
+    return _DAG_NODE_TEST_STANDALONE_TEMPLATE.substitute(
+        name=name, import_path=import_path, class_name=class_name
+    )
 
 
 
@@ -777,18 +847,16 @@ class Test{class_name}:
 # =============================================================================
 
 
-def _get_node_template(name: str) -> str:
-    """Get basic node template."""
-    return f'''"""{name} node."""
+_NODE_TEMPLATE = Template('''"""$name node."""
 
 from railway import node
 from loguru import logger
 
 
 @node
-def {name}(data: dict) -> dict:
+def $name(data: dict) -> dict:
     """
-    {name} node (pure function).
+    $name node (pure function).
 
     Args:
         data: Input data
@@ -796,24 +864,27 @@ def {name}(data: dict) -> dict:
     Returns:
         Processed data
     """
-    logger.info(f"Processing in {name}")
+    logger.info(f"Processing in $name")
     # TODO: Add implementation
     return data
-'''
+''')
 
 
-def _get_node_example_template(name: str) -> str:
-    """Get example node template."""
-    return f'''"""{name} node with example implementation."""
+def _get_node_template(name: str) -> str:
+    """Get basic node template."""
+    return _NODE_TEMPLATE.substitute(name=name)
+
+
+_NODE_EXAMPLE_TEMPLATE = Template('''"""$name node with example implementation."""
 
 from railway import node
 from loguru import logger
 
 
 @node
-def {name}(data: dict) -> dict:
+def $name(data: dict) -> dict:
     """
-    {name} node (pure function).
+    $name node (pure function).
 
     Features:
     - Type annotations
@@ -827,18 +898,23 @@ def {name}(data: dict) -> dict:
     Returns:
         Processed data dictionary
     """
-    logger.info(f"Starting {name} with {{len(data)}} fields")
+    logger.info(f"Starting $name with {len(data)} fields")
 
     # Immutable transformation (original data unchanged)
-    result = {{
+    result = {
         **data,
-        "processed_by": "{name}",
+        "processed_by": "$name",
         "status": "completed",
-    }}
+    }
 
-    logger.debug(f"Processed result: {{result}}")
+    logger.debug(f"Processed result: {result}")
     return result
-'''
+''')
+
+
+def _get_node_example_template(name: str) -> str:
+    """Get example node template."""
+    return _NODE_EXAMPLE_TEMPLATE.substitute(name=name)
 
 
 # =============================================================================
@@ -846,55 +922,55 @@ def {name}(data: dict) -> dict:
 # =============================================================================
 
 
-def _get_entry_test_template(name: str) -> str:
-    """Get Board mode test template for an entry point.
-
-    BoardBase を使い、開始ノードを直接テストするテンプレート。
-
-    Note:
-        Board モードでは CliRunner よりも
-        ノード単体テストを推奨する。
-    """
-    class_name = "".join(word.title() for word in name.split("_"))
-    return f'''"""Tests for {name} workflow."""
+_ENTRY_TEST_TEMPLATE = Template('''"""Tests for $name workflow."""
 from railway.core.board import BoardBase
 from railway.core.dag import Outcome
 
 
-class Test{class_name}:
-    """{name} ワークフローのテスト。"""
+class Test$class_name:
+    """$name ワークフローのテスト。"""
 
     def test_start_node(self) -> None:
         """開始ノードが Outcome を返す。"""
-        from nodes.{name}.start import start
+        from nodes.$name.start import start
 
         board = BoardBase()
         outcome = start(board)
         assert isinstance(outcome, Outcome)
-'''
+''')
 
 
-def _get_node_test_template(name: str) -> str:
-    """Get test template for a node (TDD-style skeleton)."""
-    class_name = "".join(word.title() for word in name.split("_"))
-    return f'''"""Tests for {name} node."""
+def _get_entry_test_template(name: str) -> str:
+    """Get Board mode test template for an entry point.
+
+    BoardBase を使い、開始ノードを直接テストするテンプレート。
+
+    Note:
+        Board モードでは CliRunner よりも
+        ノード単体テストを推奨する。
+    """
+    class_name = _snake_to_class(name)
+    return _ENTRY_TEST_TEMPLATE.substitute(name=name, class_name=class_name)
+
+
+_NODE_TEST_TEMPLATE = Template('''"""Tests for $name node."""
 
 import pytest
 
-from nodes.{name} import {name}
+from nodes.$name import $name
 
 
-class Test{class_name}:
-    """Test suite for {name} node.
+class Test$class_name:
+    """Test suite for $name node.
 
     TDD Workflow:
     1. Edit this file to define expected behavior
-    2. Run: uv run pytest tests/nodes/test_{name}.py -v (expect failure)
-    3. Implement src/nodes/{name}.py
+    2. Run: uv run pytest tests/nodes/test_$name.py -v (expect failure)
+    3. Implement src/nodes/$name.py
     4. Run tests again (expect success)
     """
 
-    def test_{name}_basic(self):
+    def test_${name}_basic(self):
         """TODO: Define expected behavior and implement test.
 
         Example:
@@ -902,17 +978,23 @@ class Test{class_name}:
             input_data = your_input_here
 
             # Act
-            result = {name}(input_data)
+            result = $name(input_data)
 
             # Assert
             assert result == expected_output
         """
         pytest.skip("Implement this test based on your node's specification")
 
-    def test_{name}_edge_case(self):
+    def test_${name}_edge_case(self):
         """TODO: Test edge cases and error handling."""
         pytest.skip("Implement edge case tests")
-'''
+''')
+
+
+def _get_node_test_template(name: str) -> str:
+    """Get test template for a node (TDD-style skeleton)."""
+    class_name = _snake_to_class(name)
+    return _NODE_TEST_TEMPLATE.substitute(name=name, class_name=class_name)
 
 
 # =============================================================================
@@ -921,23 +1003,18 @@ class Test{class_name}:
 
 
 def _create_contract(
+    cwd: str,
     name: str,
     entity: bool,
     params: bool,
     force: bool,
 ) -> None:
     """Create a new Contract."""
-    contracts_dir = Path.cwd() / "src" / "contracts"
-    if not contracts_dir.exists():
-        contracts_dir.mkdir(parents=True)
-        (contracts_dir / "__init__.py").write_text('"""Contract modules."""\n')
+    contracts_dir = os.path.join(cwd, "src", "contracts")
+    _create_package_dir(contracts_dir, '"""Contract modules."""\n')
 
     file_name = _camel_to_snake(name)
-    file_path = contracts_dir / f"{file_name}.py"
-
-    if file_path.exists() and not force:
-        typer.echo(f"Error: {file_path} already exists. Use --force to overwrite.", err=True)
-        raise typer.Exit(1)
+    file_path = os.path.join(contracts_dir, f"{file_name}.py")
 
     if params:
         content = _get_params_contract_template(name)
@@ -946,28 +1023,32 @@ def _create_contract(
     else:
         content = _get_contract_template(name)
 
-    _write_file(file_path, content)
+    if force:
+        _overwrite_file(file_path, content)
+    elif not write_new_file(file_path, content.encode()):
+        typer.echo(f"Error: {file_path} already exists. Use --force to overwrite.", err=True)
+        raise typer.Exit(1)
 
-    typer.echo(f"Created contract: src/contracts/{file_name}.py")
-    typer.echo("\nTo use in a node:")
-    typer.echo(f"  from contracts.{file_name} import {name}")
+    typer.echo(
+        f"Created contract: src/contracts/{file_name}.py\n"
+        "\nTo use in a node:\n"
+        f"  from contracts.{file_name} import {name}"
+    )
 
 
-def _create_entry_test(name: str) -> None:
+def _create_entry_test(cwd: str, name: str) -> None:
     """Create test file for entry point."""
-    tests_dir = Path.cwd() / "tests"
-    if not tests_dir.exists():
-        tests_dir.mkdir(parents=True)
+    tests_dir = os.path.join(cwd, "tests")
+    os.makedirs(tests_dir, exist_ok=True)
 
-    test_file = tests_dir / f"test_{name}.py"
-    if test_file.exists():
-        return  # Don't overwrite existing tests
-
-    content = _get_entry_test_template(name)
-    _write_file(test_file, content)
+    # Don't overwrite existing tests
+    write_new_file(
+        os.path.join(tests_dir, f"test_{name}.py"), _get_entry_test_template(name).encode()
+    )
 
 
 def _create_entry(
+    cwd: str,
     name: str,
     example: bool,
     force: bool,
@@ -976,6 +1057,7 @@ def _create_entry(
     """Create a new entry point (dag mode).
 
     Args:
+        cwd: プロジェクトルート
         name: エントリポイント名
         example: サンプルコードを含めるか
         force: 既存ファイルを上書きするか
@@ -985,23 +1067,17 @@ def _create_entry(
         既存ファイルがあっても処理を続行する
         （YAML 変換、transitions 再生成のため）
     """
-    _create_dag_entry(name, sync=sync)
+    _create_dag_entry(cwd, name, sync=sync)
 
     # Create test file (only if not exists)
-    test_path = Path.cwd() / "tests" / f"test_{name}.py"
-    if not test_path.exists():
-        _create_entry_test(name)
+    _create_entry_test(cwd, name)
 
 
 def _find_existing_yaml(graphs_dir: Path, name: str) -> Path | None:
     """既存の YAML ファイルを検索（純粋関数）。"""
     pattern = f"{name}_*.yml"
-    matches = list(graphs_dir.glob(pattern))
-    if not matches:
-        return None
     # 最新のタイムスタンプを持つファイルを返す
-    matches.sort(key=lambda p: p.name, reverse=True)
-    return matches[0]
+    return max(graphs_dir.glob(pattern), key=lambda p: p.name, default=None)
 
 
 def _is_old_format_yaml(yaml_content: str) -> bool:
@@ -1027,7 +1103,7 @@ def _convert_old_format_yaml(yaml_path: Path) -> str:
 
     if result.success:
         new_content = yaml.safe_dump(result.data, allow_unicode=True, sort_keys=False)
-        yaml_path.write_text(new_content)
+        _write_file(yaml_path, new_content)
         typer.echo(f"  変換: {yaml_path.name}（旧形式 → 新形式）")
         return new_content
     else:
@@ -1035,10 +1111,11 @@ def _convert_old_format_yaml(yaml_path: Path) -> str:
         return content
 
 
-def _create_dag_entry(name: str, sync: bool = True) -> None:
+def _create_dag_entry(cwd: str, name: str, sync: bool = True) -> None:
     """Create dag_runner style entry point with nodes and YAML.
 
     Args:
+        cwd: プロジェクトルート
         name: エントリポイント名
         sync: sync を実行するか（デフォルト True）
 
@@ -1048,14 +1125,15 @@ def _create_dag_entry(name: str, sync: bool = True) -> None:
         - YAML 新形式: 何もしない（既存を使用）
         - transitions: 常に再生成
     """
-    cwd = Path.cwd()
-    src_dir = cwd / "src"
-    nodes_dir = src_dir / "nodes" / name
-    graphs_dir = cwd / "transition_graphs"
-    output_dir = cwd / "_railway" / "generated"
+    src_dir = os.path.join(cwd, "src")
+    nodes_dir = os.path.join(src_dir, "nodes", name)
+    # YAML 検索・sync・終端ノード生成は Path を受け取る
+    project_root = Path(cwd)
+    graphs_dir = project_root / "transition_graphs"
+    output_dir = project_root / "_railway" / "generated"
 
     # Create directories
-    nodes_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(nodes_dir, exist_ok=True)
 
     # 1. Check for existing YAML
     existing_yaml = _find_existing_yaml(graphs_dir, name)
@@ -1077,14 +1155,13 @@ def _create_dag_entry(name: str, sync: bool = True) -> None:
         yaml_created = True
 
     # 2. Create start node (only if not exists)
-    start_node_path = nodes_dir / "start.py"
-    if not start_node_path.exists():
-        node_content = _get_dag_node_template(name)
-        (nodes_dir / "__init__.py").touch()
-        _write_file(start_node_path, node_content)
+    if write_new_file(
+        os.path.join(nodes_dir, "start.py"), _get_dag_node_template(name).encode()
+    ):
+        write_new_file(os.path.join(nodes_dir, "__init__.py"), b"")
 
     # 3. Generate exit nodes from YAML (skips existing)
-    exit_result = _generate_exit_nodes_from_yaml(yaml_content, cwd)
+    exit_result = _generate_exit_nodes_from_yaml(yaml_content, project_root)
 
     # 4. Sync transition (if enabled) - always regenerate
     if sync:
@@ -1092,17 +1169,15 @@ def _create_dag_entry(name: str, sync: bool = True) -> None:
         _run_sync_for_entry(name, graphs_dir, output_dir)
 
     # 5. Create entrypoint (only if not exists)
-    entry_path = src_dir / f"{name}.py"
-    if not entry_path.exists():
-        if sync:
-            entry_content = _get_dag_entry_template(name)
-        else:
-            entry_content = _get_dag_entry_template_pending_sync(name)
-        _write_file(entry_path, entry_content)
+    if sync:
+        entry_content = _get_dag_entry_template(name)
+    else:
+        entry_content = _get_dag_entry_template_pending_sync(name)
+    write_new_file(os.path.join(src_dir, f"{name}.py"), entry_content.encode())
 
     # Output messages
     _print_dag_entry_created(
-        name, timestamp, exit_result, sync,
+        cwd, name, timestamp, exit_result, sync,
         yaml_created=yaml_created,
         existing_yaml=existing_yaml,
     )
@@ -1138,6 +1213,7 @@ def _run_sync_for_entry(
 
 
 def _print_dag_entry_created(
+    cwd: str,
     name: str,
     timestamp: str,
     exit_result: "SyncResult",
@@ -1145,38 +1221,44 @@ def _print_dag_entry_created(
     yaml_created: bool = True,
     existing_yaml: Path | None = None,
 ) -> None:
-    """生成結果を表示する（副作用あり: 標準出力）。"""
+    """生成結果を表示する（副作用あり: 標準出力）。
+
+    全行をまとめて 1 回の echo で出力する。
+    """
     if yaml_created:
-        typer.echo(f"✓ エントリーポイント '{name}' を作成しました（モード: dag）\n")
-        typer.echo(f"  作成: src/{name}.py")
-        typer.echo(f"  作成: src/nodes/{name}/start.py")
-        typer.echo(f"  作成: transition_graphs/{name}_{timestamp}.yml")
+        lines = [
+            f"✓ エントリーポイント '{name}' を作成しました（モード: dag）\n",
+            f"  作成: src/{name}.py",
+            f"  作成: src/nodes/{name}/start.py",
+            f"  作成: transition_graphs/{name}_{timestamp}.yml",
+        ]
     else:
-        typer.echo(f"✓ エントリーポイント '{name}' を更新しました（モード: dag）\n")
+        lines = [f"✓ エントリーポイント '{name}' を更新しました（モード: dag）\n"]
         if existing_yaml:
-            typer.echo(f"  使用: {existing_yaml.name}")
+            lines.append(f"  使用: {existing_yaml.name}")
 
-    cwd = Path.cwd()
     for path in exit_result.generated:
         relative = path.relative_to(cwd)
-        typer.echo(f"  作成: {relative}")
+        lines.append(f"  作成: {relative}")
 
     if sync:
-        typer.echo(f"  生成: _railway/generated/{name}_transitions.py")
+        lines.append(f"  生成: _railway/generated/{name}_transitions.py")
 
-    typer.echo("")
+    lines += ["", "次のステップ:"]
     if sync:
-        typer.echo("次のステップ:")
-        typer.echo(f"  railway run {name}")
+        lines.append(f"  railway run {name}")
     else:
-        typer.echo("次のステップ:")
-        typer.echo(f"  1. transition_graphs/{name}_*.yml を編集（オプション）")
-        typer.echo(f"  2. railway sync transition --entry {name}")
-        typer.echo(f"  3. railway run {name}")
+        lines += [
+            f"  1. transition_graphs/{name}_*.yml を編集（オプション）",
+            f"  2. railway sync transition --entry {name}",
+            f"  3. railway run {name}",
+        ]
+    typer.echo("\n".join(lines))
 
 
 
 def _create_node_contract(
+    cwd: str,
     name: str,
     force: bool = False,
     *,
@@ -1187,14 +1269,13 @@ def _create_node_contract(
     副作用あり: src/contracts/ にファイルを作成
 
     Args:
+        cwd: プロジェクトルート
         name: パス形式の名前（"processing/validate"）
         force: 上書きフラグ
         func_name: 関数名（"validate"）。省略時は name から導出。
     """
-    contracts_dir = Path.cwd() / "src" / "contracts"
-    if not contracts_dir.exists():
-        contracts_dir.mkdir(parents=True)
-        (contracts_dir / "__init__.py").write_text('"""Contract modules."""\n')
+    contracts_dir = os.path.join(cwd, "src", "contracts")
+    _create_package_dir(contracts_dir, '"""Contract modules."""\n')
 
     _create_single_contract(
         contracts_dir,
@@ -1205,7 +1286,7 @@ def _create_node_contract(
 
 
 def _create_single_contract(
-    contracts_dir: Path,
+    contracts_dir: str,
     file_name: str,
     content: str,
     force: bool,
@@ -1214,13 +1295,16 @@ def _create_single_contract(
 
     Side effects: Creates or overwrites file
     """
-    file_path = contracts_dir / f"{file_name}.py"
-    if not file_path.exists() or force:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        _write_file(file_path, content)
+    file_path = os.path.join(contracts_dir, f"{file_name}.py")
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if force:
+        _overwrite_file(file_path, content)
+    else:
+        write_new_file(file_path, content.encode())
 
 
 def _create_node_test(
+    cwd: str,
     name: str,
     output_type: str | None = None,
     inputs: list[tuple[str, str]] | None = None,
@@ -1230,25 +1314,20 @@ def _create_node_test(
     """Create test file for node.
 
     Args:
+        cwd: プロジェクトルート
         name: パス形式の名前（"processing/validate"）
         module_path: Python import パス（"processing.validate"）
     """
-    tests_dir = Path.cwd() / "tests" / "nodes"
-    if not tests_dir.exists():
-        tests_dir.mkdir(parents=True)
+    tests_dir = os.path.join(cwd, "tests", "nodes")
 
     # サブディレクトリ付き名前（processing/validate）の場合、
     # テストファイルは tests/nodes/processing/test_validate.py に配置
     if "/" in name:
         parts = name.rsplit("/", 1)
         func_name = parts[1]
-        test_file = tests_dir / parts[0] / f"test_{func_name}.py"
+        tests_dir = os.path.join(tests_dir, parts[0])
     else:
         func_name = name
-        test_file = tests_dir / f"test_{name}.py"
-
-    if test_file.exists():
-        return  # Don't overwrite existing tests
 
     if output_type:
         content = _get_typed_node_test_template(func_name, output_type, inputs or [])
@@ -1257,8 +1336,9 @@ def _create_node_test(
             func_name, module_path=module_path
         )
 
-    test_file.parent.mkdir(parents=True, exist_ok=True)
-    _write_file(test_file, content)
+    os.makedirs(tests_dir, exist_ok=True)
+    # Don't overwrite existing tests
+    write_new_file(os.path.join(tests_dir, f"test_{func_name}.py"), content.encode())
 
 
 def _parse_input_spec(input_spec: str) -> tuple[str, str]:
@@ -1286,6 +1366,7 @@ def _parse_input_spec(input_spec: str) -> tuple[str, str]:
 
 
 def _create_node(
+    cwd: str,
     name: str,
     example: bool,
     force: bool,
@@ -1296,16 +1377,10 @@ def _create_node(
     # ドット区切り名を分解（"processing.validate" → パス/関数名/モジュールパス）
     path_form, func_name, module_path = _resolve_hierarchical_name(name)
 
-    nodes_dir = Path.cwd() / "src" / "nodes"
-    if not nodes_dir.exists():
-        nodes_dir.mkdir(parents=True)
-        (nodes_dir / "__init__.py").write_text('"""Node modules."""\n')
+    nodes_dir = os.path.join(cwd, "src", "nodes")
+    _create_package_dir(nodes_dir, '"""Node modules."""\n')
 
-    file_path = nodes_dir / f"{path_form}.py"
-
-    if file_path.exists() and not force:
-        typer.echo(f"Error: {file_path} already exists. Use --force to overwrite.", err=True)
-        raise typer.Exit(1)
+    file_path = os.path.join(nodes_dir, f"{path_form}.py")
 
     # Parse inputs (for --input option)
     inputs: list[tuple[str, str]] = []
@@ -1320,11 +1395,15 @@ def _create_node(
         # Board モード: Contract ファイルは生成しない
         content = _get_dag_node_standalone_template(func_name, module_path=module_path)
 
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    _write_file(file_path, content)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if force:
+        _overwrite_file(file_path, content)
+    elif not write_new_file(file_path, content.encode()):
+        typer.echo(f"Error: {file_path} already exists. Use --force to overwrite.", err=True)
+        raise typer.Exit(1)
 
     # Create test file
-    _create_node_test(path_form, output_type, inputs, module_path=module_path)
+    _create_node_test(cwd, path_form, output_type, inputs, module_path=module_path)
 
     # Build test file display path (mirrors _create_node_test logic)
     if "/" in path_form:
@@ -1334,21 +1413,24 @@ def _create_node(
         test_display_path = f"tests/nodes/test_{func_name}.py"
 
     # Output messages
-    typer.echo(f"Created src/nodes/{path_form}.py")
-    typer.echo(f"Created {test_display_path}\n")
-
     if output_type:
-        typer.echo("To use in a typed pipeline:")
-        typer.echo(f"  from nodes.{module_path} import {func_name}")
-        typer.echo(f"  result = typed_pipeline({func_name})")
+        usage = (
+            "To use in a typed pipeline:\n"
+            f"  from nodes.{module_path} import {func_name}\n"
+            f"  result = typed_pipeline({func_name})"
+        )
     else:
-        typer.echo("TDD style workflow:")
-        typer.echo(f"   1. Define tests in {test_display_path}")
-        typer.echo(f"   2. Run: uv run pytest {test_display_path} -v")
-        typer.echo(f"   3. Implement src/nodes/{path_form}.py")
-        typer.echo("   4. Run tests again\n")
-        typer.echo("To use in an entry point:")
-        typer.echo(f"  from nodes.{module_path} import {func_name}")
+        usage = (
+            "TDD style workflow:\n"
+            f"   1. Define tests in {test_display_path}\n"
+            f"   2. Run: uv run pytest {test_display_path} -v\n"
+            f"   3. Implement src/nodes/{path_form}.py\n"
+            "   4. Run tests again\n"
+            "\n"
+            "To use in an entry point:\n"
+            f"  from nodes.{module_path} import {func_name}"
+        )
+    typer.echo(f"Created src/nodes/{path_form}.py\nCreated {test_display_path}\n\n{usage}")
 
 
 # =============================================================================
@@ -1392,8 +1474,10 @@ def new(
 
     Documentation: https://pypi.org/project/railway-framework/
     """
+    cwd = os.getcwd()
+
     # Validate we're in a project
-    if not _is_railway_project():
+    if not _is_railway_project(cwd):
         typer.echo("Error: Not in a Railway project (src/ directory not found)", err=True)
         raise typer.Exit(1)
 
@@ -1427,8 +1511,8 @@ def new(
         name = validation.normalized
 
     if component_type == ComponentType.contract:
-        _create_contract(name, entity, params, force)
+        _create_contract(cwd, name, entity, params, force)
     elif component_type == ComponentType.entry:
-        _create_entry(name, example, force, sync=not no_sync)
+        _create_entry(cwd, name, example, force, sync=not no_sync)
     else:  # node
-        _create_node(name, example, force, output, input_specs)
+        _create_node(cwd, name, example, force, output, input_specs)
@@ -8,6 +8,7 @@ Issue #44: Exit node skeleton generation support added.
 """
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -31,6 +32,9 @@ from railway.core.dag.types import NodeDefinition, TransitionGraph
 from railway.core.dag.validator import validate_graph
 from railway.migrations.yaml_converter import convert_yaml_structure
 
+# {entry_name}_{timestamp}.yml -> entry_name
+_YAML_ENTRY_PATTERN = re.compile(r"^(.+?)_\d+\.yml$")
+
 # =============================================================================
 # Issue #44: Exit Node Skeleton Generation
 # =============================================================================
@@ -830,6 +834,20 @@ def _matches_entry_yaml(filename: str, entry_name: str) -> bool:
     return pattern.match(filename) is not None
 
 
+def _yaml_file_names(graphs_dir: Path) -> list[str]:
+    """graphs_dir 直下の *.yml ファイル名を列挙する。
+
+    glob と違いパターンのコンパイルやパスの組み立てを行わず、
+    scandir の名前をそのまま返す。ディレクトリが無い、ファイルである、
+    読めない（OSError）場合は glob と同じく空リスト。
+    """
+    try:
+        with os.scandir(graphs_dir) as it:
+            return [entry.name for entry in it if entry.name.endswith(".yml")]
+    except OSError:
+        return []
+
+
 def find_latest_yaml(graphs_dir: Path, entry_name: str) -> Path | None:
     """
     Find the latest YAML file for an entrypoint.
@@ -845,19 +863,11 @@ def find_latest_yaml(graphs_dir: Path, entry_name: str) -> Path | None:
         Path to latest YAML, or None if not found
     """
     pattern = re.compile(rf"^{re.escape(entry_name)}_(\d+)\.yml$")
-    matches: list[tuple[int, Path]] = []
-
-    for p in graphs_dir.glob("*.yml"):
-        m = pattern.match(p.name)
-        if m:
-            matches.append((int(m.group(1)), p))
-
-    if not matches:
-        return None
+    matches = (pattern.match(name) for name in _yaml_file_names(graphs_dir))
 
-    # Sort by numeric suffix descending
-    matches.sort(key=lambda x: x[0], reverse=True)
-    return matches[0][1]
+    # Single pass for the largest numeric suffix (no list, no sort)
+    latest = max((m for m in matches if m), key=lambda m: int(m.group(1)), default=None)
+    return None if latest is None else graphs_dir / latest.string
 
 
 def find_all_entrypoints(graphs_dir: Path) -> list[str]:
@@ -870,12 +880,5 @@ def find_all_entrypoints(graphs_dir: Path) -> list[str]:
     Returns:
         List of unique entrypoint names
     """
-    entries: set[str] = set()
-    pattern = re.compile(r"^(.+?)_\d+\.yml$")
-
-    for path in graphs_dir.glob("*.yml"):
-        match = pattern.match(path.name)
-        if match:
-            entries.add(match.group(1))
-
-    return sorted(entries)
+    matches = (_YAML_ENTRY_PATTERN.match(name) for name in _yaml_file_names(graphs_dir))
+    return sorted({match.group(1) for match in matches if match})
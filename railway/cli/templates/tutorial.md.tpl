@@ -0,0 +1,719 @@
+# $project_name チュートリアル
+
+Railway Framework の**DAGワークフロー（Board モード）**を体験しましょう！
+
+## 学べること
+
+- dag_runner による条件分岐ワークフロー
+- Board パターン（ミュータブル共有状態）
+- Outcome クラスによる状態返却
+- WorkflowResult による結果取得
+- 遷移グラフ（YAML）の定義
+- コード生成（railway sync transition）
+- Trace モードによるデバッグ
+- バージョン管理と安全なアップグレード
+
+## 所要時間
+
+約15分
+
+## 前提条件
+
+- Python 3.10以上
+- uv インストール済み（`curl -LsSf https://astral.sh/uv/install.sh | sh`）
+- VSCode推奨（IDE補完を体験するため）
+
+## セットアップ
+
+```bash
+uv sync --group dev
+cp .env.example .env
+```
+
+---
+
+## Step 1: Hello World（2分）
+
+まずは動作確認から。
+
+### 1.1 実行
+
+```bash
+uv run railway run hello
+```
+
+**期待される出力:**
+```
+Hello, World!
+```
+
+次のStepでは、DAGワークフローの核心を学びます。
+
+---
+
+## Step 2: はじめてのDAGワークフロー（5分）
+
+DAGワークフローでは、条件分岐を含むワークフローを定義できます。
+
+### 2.1 エントリーポイント作成
+
+```bash
+railway new entry greeting
+```
+
+以下のファイルが生成されます：
+
+- `src/greeting.py` - エントリーポイント（dag_runner使用）
+- `src/nodes/greeting/start.py` - 開始ノード（Board モード）
+- `transition_graphs/greeting_*.yml` - 遷移グラフ定義
+
+### 2.2 すぐに実行可能！
+
+`railway new entry` は自動的にコード生成も行います。
+
+```bash
+railway run greeting
+```
+
+**期待される出力:**
+```
+Running entry point: greeting
+... (ログ出力)
+✓ 完了 (exit_state=success.done)
+```
+
+> **Note:** 実際の出力にはタイムスタンプとログレベルが含まれます（loguru による stderr 出力）。
+
+### 2.3 遷移グラフを確認
+
+`transition_graphs/greeting_*.yml` を開いて確認してください:
+
+```yaml
+version: "1.0"
+entrypoint: greeting
+description: "greeting ワークフロー"
+
+nodes:
+  start:
+    module: nodes.greeting.start
+    function: start
+    description: "開始ノード"
+
+  # 終端ノードは nodes.exit 配下に定義
+  exit:
+    success:
+      done:
+        description: "正常終了"
+    failure:
+      error:
+        description: "エラー終了"
+
+start: start
+
+transitions:
+  start:
+    success::done: exit.success.done
+    failure::error: exit.failure.error
+```
+
+編集後は再同期：
+
+```bash
+railway sync transition --entry greeting
+```
+
+---
+
+## Step 3: ノードの実装 - Board と Outcome を使う（3分）
+
+DAGワークフローのノードは `board`（共有状態）を受け取り、`Outcome` を返す純粋関数です。
+
+### 3.1 Board モードのノード基本形
+
+`src/nodes/greeting/start.py` を確認:
+
+```python
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def start(board) -> Outcome:
+    """開始ノード
+
+    Args:
+        board: Board（共有状態）
+    """
+    # board にデータを書き込む
+    board.message = "Hello, Railway!"
+    return Outcome.success("done")
+```
+
+**Board モードの特徴:**
+- ノードは `board` を受け取り `Outcome` のみを返す
+- `board` に直接属性を読み書きする（`model_copy` 不要）
+- Contract 定義なしでシンプルに実装可能
+- `railway sync transition` が AST 解析でフィールド依存を自動検出
+
+### 3.2 Outcome クラス
+
+`Outcome` は状態を簡潔に表現します:
+
+```python
+# 成功状態
+Outcome.success("done")      # → success::done
+Outcome.success("validated") # → success::validated
+
+# 失敗状態
+Outcome.failure("error")     # → failure::error
+Outcome.failure("timeout")   # → failure::timeout
+```
+
+**ポイント:**
+- ノードは状態を返すだけ
+- 次のノードへの遷移はYAMLで定義
+- 純粋関数として実装
+
+### 3.3 WorkflowResult
+
+dag_runner は `WorkflowResult` を返します:
+
+```python
+from railway.core.board import WorkflowResult
+
+result = dag_runner(start=start, transitions=TRANSITIONS, board=board)
+result.is_success      # True if exit_code == 0
+result.exit_code       # 0 (success) or 1 (failure)
+result.exit_state      # "success.done" など
+result.board           # board オブジェクト（最終状態）
+result.execution_path  # ("start", "process", "exit.success.done")
+result.iterations      # 実行したノード数
+result.trace           # トレース情報（--trace 指定時のみ）
+```
+
+### 3.4 Contract（型契約）との関係
+
+Board モードは DAG ワークフローの新しいデフォルトです。
+Contract は線形パイプライン（`typed_pipeline`）で引き続き使用されます。
+
+| 用途 | パターン | 入出力 |
+|------|----------|--------|
+| DAGワークフロー（推奨） | Board モード | `board` → `Outcome` |
+| 線形パイプライン | Contract モード | `Contract` → `Contract` |
+
+---
+
+## Step 4: 条件分岐ワークフロー（5分）
+
+時間帯に応じて挨拶を変えるワークフローを作成します。
+
+### 4.1 遷移グラフを編集
+
+`transition_graphs/greeting_*.yml` を以下のように編集:
+
+```yaml
+version: "1.0"
+entrypoint: greeting
+description: "挨拶ワークフロー"
+
+nodes:
+  check_time:
+    description: "時間帯を判定"
+  greet_morning:
+    description: "朝の挨拶"
+  greet_afternoon:
+    description: "午後の挨拶"
+  greet_evening:
+    description: "夜の挨拶"
+
+  # 終端ノード
+  exit:
+    success:
+      done:
+        description: "正常終了"
+
+start: check_time
+
+transitions:
+  check_time:
+    success::morning: greet_morning
+    success::afternoon: greet_afternoon
+    success::evening: greet_evening
+  greet_morning:
+    success::done: exit.success.done
+  greet_afternoon:
+    success::done: exit.success.done
+  greet_evening:
+    success::done: exit.success.done
+```
+
+**ポイント:**
+- `module/function` は省略可能（`nodes.{entrypoint}.{ノード名}` に自動解決）
+- 例: `check_time` → `nodes.greeting.check_time` に解決
+- 終端ノードは `nodes.exit` 配下に定義（entrypoint を含まない）
+- 遷移先は `exit.success.done` 形式で指定
+
+### 4.2 ノードを実装
+
+Board モードでは `board` に直接読み書きし、`Outcome` を返します。
+
+`src/nodes/greeting/check_time.py`:
+
+```python
+from datetime import datetime
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def check_time(board) -> Outcome:
+    """時間帯を判定して状態を返す
+
+    Args:
+        board: Board（共有状態）
+    """
+    hour = datetime.now().hour
+
+    if 5 <= hour < 12:
+        board.period = "morning"
+        return Outcome.success("morning")
+    elif 12 <= hour < 18:
+        board.period = "afternoon"
+        return Outcome.success("afternoon")
+    else:
+        board.period = "evening"
+        return Outcome.success("evening")
+```
+
+**Board モードの利点:**
+- Contract 定義が不要（`board.period = "morning"` で直接書き込み）
+- `model_copy` が不要（`board` はミュータブル）
+- `tuple` 返り値が不要（`Outcome` のみ返す）
+- `railway sync transition` が `board.period` を AST 解析で自動検出
+
+**テスト時の初期状態注入:**
+
+```python
+from railway.core.board import BoardBase
+
+board = BoardBase(hour_override=10)  # テスト用の初期状態
+outcome = check_time(board)
+```
+
+これにより、**テスト時に任意の初期状態を注入できます**。
+
+`src/nodes/greeting/greet_morning.py`:
+
+```python
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def greet_morning(board) -> Outcome:
+    """朝の挨拶"""
+    print("おはようございます！")
+    board.greeting = "おはようございます！"
+    return Outcome.success("done")
+```
+
+`src/nodes/greeting/greet_afternoon.py`:
+
+```python
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def greet_afternoon(board) -> Outcome:
+    """午後の挨拶"""
+    print("こんにちは！")
+    board.greeting = "こんにちは！"
+    return Outcome.success("done")
+```
+
+`src/nodes/greeting/greet_evening.py`:
+
+```python
+from railway import node
+from railway.core.dag import Outcome
+
+
+@node
+def greet_evening(board) -> Outcome:
+    """夜の挨拶"""
+    print("こんばんは！")
+    board.greeting = "こんばんは！"
+    return Outcome.success("done")
+```
+
+**ポイント:**
+- `module/function` を省略すると、ノード名からファイルが自動解決される
+- 例: `greet_morning` → `nodes.greeting.greet_morning` モジュールの `greet_morning` 関数
+
+**応用: module 明示パターン**
+
+1ファイルに複数関数を配置したい場合は、YAML で `module` を明示できます:
+
+```yaml
+# YAML で module を明示すれば、1 ファイルに複数関数を配置可能
+nodes:
+  greet_morning:
+    module: nodes.greeting.greet
+    function: greet_morning
+  greet_afternoon:
+    module: nodes.greeting.greet
+    function: greet_afternoon
+  greet_evening:
+    module: nodes.greeting.greet
+    function: greet_evening
+```
+
+### 4.3 コード生成と実行
+
+```bash
+# コード生成
+railway sync transition --entry greeting
+
+# 実行
+railway run greeting
+```
+
+出力例:
+
+```
+Running entry point: greeting
+... (ログ出力)
+✓ 完了 (exit_state=success.done)
+```
+
+---
+
+## Step 5: railway new node でノードを素早く追加（3分）
+
+既存のワークフローに新しいノードを追加する方法を学びます。
+ここで体験するのは「**ファイルを1コマンドで生成し、即座にTDDを開始できる**」という恩恵です。
+
+### 5.1 1コマンドで2ファイル生成
+
+```bash
+railway new node log_result
+```
+
+**たった1コマンドで以下が生成されます:**
+
+| ファイル | 役割 | 恩恵 |
+|----------|------|------|
+| `src/nodes/log_result.py` | ノード本体 | 動作するサンプル付き |
+| `tests/nodes/test_log_result.py` | テスト | すぐにTDD開始可能 |
+
+> **Note:** Board モードでは Contract ファイルは生成されません。
+> board に直接読み書きするため、別途 Contract 定義が不要です。
+
+### 5.2 TDDワークフローを体験
+
+**Step 1: テストを編集（期待する動作を定義）**
+
+`tests/nodes/test_log_result.py` を開き、具体的なテストを追加。
+
+**Step 2: テスト実行（失敗を確認 = Red）**
+
+```bash
+uv run pytest tests/nodes/test_log_result.py -v
+```
+
+失敗することを確認。これがTDDの「Red」フェーズです。
+
+**Step 3: 実装（テストを通す = Green）**
+
+`src/nodes/log_result.py` を実装。
+
+**Step 4: テスト再実行（成功を確認）**
+
+成功！これがTDDの「Green」フェーズです。
+
+### 5.3 階層ノード
+
+ドット区切りでサブディレクトリにノードを生成できます。
+YAML の深いネスト定義と一貫した形式です。
+
+```bash
+railway new node processing.validate
+```
+
+**生成されるファイル:**
+
+| ファイル | 内容 |
+|----------|------|
+| `src/nodes/processing/validate.py` | `def validate(board)` - 関数名は最終セグメント |
+| `tests/nodes/processing/test_validate.py` | TDDテンプレート |
+
+3段以上のネストも可能です:
+
+```bash
+railway new node sub.deep.process
+# → src/nodes/sub/deep/process.py（関数名: process）
+```
+
+**注意: 名前のバリデーション**
+
+```bash
+railway new node my-node          # ハイフン不可 → my_node を提案
+railway new node class             # Python予約語
+railway new node greeting/farewell # スラッシュ不可 → greeting.farewell を提案
+```
+
+---
+
+## Step 6: エラーハンドリング（3分）
+
+### 6.1 失敗パスの追加
+
+遷移グラフに失敗パスを追加:
+
+```yaml
+nodes:
+  exit:
+    failure:
+      error:
+        description: "エラー終了"
+
+transitions:
+  check_time:
+    success::morning: greet_morning
+    success::afternoon: greet_afternoon
+    success::evening: greet_evening
+    failure::error: exit.failure.error
+```
+
+### 6.2 ノードでのエラーハンドリング
+
+```python
+@node
+def check_time(board) -> Outcome:
+    """時間帯を判定"""
+    try:
+        hour = datetime.now().hour
+        if 5 <= hour < 12:
+            board.period = "morning"
+            return Outcome.success("morning")
+        elif 12 <= hour < 18:
+            board.period = "afternoon"
+            return Outcome.success("afternoon")
+        else:
+            board.period = "evening"
+            return Outcome.success("evening")
+    except Exception:
+        board.error = "時間帯の判定に失敗"
+        return Outcome.failure("error")
+```
+
+**ポイント:**
+- 想定内のエラーは `Outcome.failure()` で表現
+- 遷移グラフで適切な終端ノードへルーティング
+- 例外は「プログラムのバグ」として伝播（try-except は最小限に）
+
+---
+
+## Step 7: ステップコールバック（3分）
+
+### 7.1 StepRecorder で実行履歴を記録
+
+```python
+from railway.core.dag import dag_runner, StepRecorder
+
+recorder = StepRecorder()
+
+result = dag_runner(
+    start=check_time,
+    transitions=TRANSITIONS,
+    on_step=recorder,
+)
+
+# 実行履歴を確認
+for step in recorder.get_history():
+    print(f"[{step.node_name}] -> {step.state}")
+```
+
+### 7.2 AuditLogger で監査ログ
+
+```python
+from railway.core.dag import AuditLogger
+
+audit = AuditLogger(workflow_id="incident-123")
+
+result = dag_runner(
+    start=check_time,
+    transitions=TRANSITIONS,
+    on_step=audit,
+)
+```
+
+---
+
+## Step 8: バージョン管理（3分）
+
+### 8.1 現状を確認
+
+```bash
+cat .railway/project.yaml
+```
+
+### 8.2 更新
+
+```bash
+# プレビュー
+railway update --dry-run
+
+# 実行
+railway update
+```
+
+### 8.3 バックアップから復元
+
+```bash
+railway backup list
+railway backup restore
+```
+
+---
+
+## Step 9: 既存プロジェクトのアップグレード（3分）
+
+旧バージョンのプロジェクトを最新形式にアップグレードする方法を学びます。
+
+### 9.1 変更内容をプレビュー
+
+```bash
+railway update --dry-run
+```
+
+**出力例:**
+```
+マイグレーション: 0.13.x → 0.14.0
+
+コードガイダンス:
+  src/nodes/process.py:5
+    現在: def process(ctx: ProcessContext) -> tuple[ProcessContext, Outcome]:
+    推奨: def process(board) -> Outcome:
+```
+
+### 9.2 アップグレード実行
+
+```bash
+railway update
+```
+
+### 9.3 コードを修正
+
+ガイダンスに従って、旧形式のノードを新形式に変更します。
+
+**Before:**
+```python
+@node
+def process(data: dict) -> dict:
+    return data
+```
+
+**After:**
+```python
+@node
+def process(board) -> Outcome:
+    board.result = "processed"
+    return Outcome.success("done")
+```
+
+**恩恵:**
+- Outcome で次の遷移先を制御できる
+- Board で簡潔にデータを扱える（Contract 定義不要）
+- YAML で遷移ロジックを可視化できる
+
+---
+
+## Step 10: Trace モードで実行
+
+ノードごとの Board 変更を確認できます:
+
+```bash
+railway run greeting --trace
+```
+
+出力例:
+
+```
+Trace mode enabled
+Running entry point: greeting
+... (ログ出力)
+[trace] check_time: mutations: period
+[trace] greet_morning: mutations: greeting
+✓ 完了 (exit_state=success.done)
+```
+
+各ノードがどのフィールドを変更したかが一目でわかります。
+デバッグ時に特に便利です。
+
+#### プログラムからの利用
+
+```python
+result = run(trace=True)
+if result.trace:
+    for node_trace in result.trace.traces:
+        print(f"{node_trace.node_name}: {node_trace.mutations}")
+```
+
+---
+
+## ポイントまとめ
+
+1. **ノードは状態を返すだけ** - 遷移先はYAMLで定義
+2. **Outcome を使う** - `Outcome.success("done")` で簡潔に
+3. **Board を使う** - `board.xxx` でデータを読み書き
+4. **YAMLを変更したら再sync** - `railway sync transition --entry <name>`
+5. **Trace で可視化** - `railway run <name> --trace` でデバッグ
+
+---
+
+## 次のステップ
+
+### 学んだこと
+
+- dag_runner による条件分岐ワークフロー
+- Board パターンによるデータ共有
+- Outcome クラスによる状態返却
+- 遷移グラフ（YAML）の定義
+- コード生成
+- Trace モードによるデバッグ
+- ステップコールバック
+- バージョン管理とアップグレード
+
+### さらに学ぶ
+
+- `railway docs` でフレームワークのドキュメントを表示
+- `railway docs --browser` でブラウザでドキュメントを開く
+
+---
+
+## チャレンジ
+
+1. 週末と平日で挨拶を変える分岐を追加
+2. 複数の終端ノード（exit.success.done, exit.failure.error）を使い分け
+3. CompositeCallback を使って複数のコールバックを組み合わせ
+
+---
+
+## トラブルシューティング
+
+### mypy で型チェックが効かない場合
+
+```bash
+uv sync --reinstall-package railway-framework
+rm -rf .mypy_cache/
+uv run mypy src/
+```
+
+### テストが失敗する場合
+
+```bash
+rm -rf .pytest_cache/ __pycache__/
+uv sync
+```
@@ -94,3 +94,15 @@ class TestFindLatestYaml:
         (tmp_path / "wf_abc.yml").touch()
         result = find_latest_yaml(tmp_path, "wf")
         assert result is None
+
+    def test_missing_directory_returns_none(self, tmp_path: Path) -> None:
+        """ディレクトリが存在しない場合は None。"""
+        result = find_latest_yaml(tmp_path / "missing", "wf")
+        assert result is None
+
+    def test_returns_path_inside_graphs_dir(self, tmp_path: Path) -> None:
+        """返り値は graphs_dir 配下の Path であること。"""
+        (tmp_path / "wf_1.yml").touch()
+        (tmp_path / "wf_3.yml").touch()
+        (tmp_path / "wf_2.yml").touch()
+        assert find_latest_yaml(tmp_path, "wf") == tmp_path / "wf_3.yml"
@@ -132,6 +132,39 @@ class TestRailwayInit:
             finally:
                 os.chdir(original_cwd)
 
+    def test_settings_py_loads_settings_lazily(self, tmp_path: Path) -> None:
+        """Importing settings.py should not load settings until accessed."""
+        from unittest.mock import patch
+
+        from railway.cli.init import _create_settings_py
+
+        (tmp_path / "src").mkdir()
+        _create_settings_py(tmp_path)
+        namespace: dict[str, object] = {"__name__": "settings"}
+        source = (tmp_path / "src" / "settings.py").read_text()
+        with patch("railway.core.settings.get_settings") as get_settings:
+            exec(compile(source, "settings.py", "exec"), namespace)
+            get_settings.assert_not_called()
+            assert namespace["__getattr__"]("settings") is get_settings.return_value  # type: ignore[operator]
+        with pytest.raises(AttributeError):
+            namespace["__getattr__"]("missing")  # type: ignore[operator]
+
+    def test_settings_py_declares_exported_settings(self, tmp_path: Path) -> None:
+        """settings listed in __all__ should be declared at module level."""
+        import ast
+
+        from railway.cli.init import _create_settings_py
+
+        (tmp_path / "src").mkdir()
+        _create_settings_py(tmp_path)
+        tree = ast.parse((tmp_path / "src" / "settings.py").read_text())
+        declared = {
+            node.target.id
+            for node in tree.body
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name)
+        }
+        assert "settings" in declared
+
     def test_init_creates_tutorial_md(self):
         """Should create TUTORIAL.md."""
         from railway.cli.main import app
@@ -197,6 +230,81 @@ class TestRailwayInitOptions:
             finally:
                 os.chdir(original_cwd)
 
+    def test_direct_call_uses_option_defaults(self):
+        """Calling init() directly should use the plain defaults."""
+        from railway.cli.init import init
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                init("my_project")
+                project = Path(tmpdir) / "my_project"
+                # with_examples defaults to False: the minimal hello.py
+                assert "pipeline" not in (project / "src" / "hello.py").read_text()
+                assert ">=3.10" in (project / "pyproject.toml").read_text()
+            finally:
+                os.chdir(original_cwd)
+
+
+class TestRailwayInitJobs:
+    """Test railway init --jobs option."""
+
+    def test_init_with_single_job(self):
+        """--jobs 1 should create the same project sequentially."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                result = runner.invoke(app, ["init", "my_project", "--jobs", "1"])
+                assert result.exit_code == 0
+                project = Path(tmpdir) / "my_project"
+                assert (project / "pyproject.toml").exists()
+                assert (project / "TUTORIAL.md").exists()
+                assert (project / "src" / "hello.py").exists()
+            finally:
+                os.chdir(original_cwd)
+
+    def test_init_rejects_zero_jobs(self):
+        """--jobs must be at least 1."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                result = runner.invoke(app, ["init", "my_project", "--jobs", "0"])
+                assert result.exit_code != 0
+                assert not (Path(tmpdir) / "my_project").exists()
+            finally:
+                os.chdir(original_cwd)
+
+    def test_task_error_propagates(self, tmp_path: Path) -> None:
+        """A failing file task should surface its exception."""
+        from railway.cli.init import _run_file_tasks
+
+        def fail() -> None:
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            _run_file_tasks([(fail, ())], jobs=2)
+
+    def test_task_error_propagates_from_pool(self) -> None:
+        """Batches large enough for the thread pool still surface errors."""
+        from railway.cli.init import _MIN_PARALLEL_TASKS, _run_file_tasks
+
+        calls: list[int] = []
+
+        def fail() -> None:
+            raise OSError("disk full")
+
+        tasks = [(calls.append, (i,)) for i in range(_MIN_PARALLEL_TASKS)]
+        with pytest.raises(OSError, match="disk full"):
+            _run_file_tasks([*tasks, (fail, ())], jobs=2)
+        assert sorted(calls) == list(range(_MIN_PARALLEL_TASKS))
+
 
 class TestRailwayInitErrors:
     """Test railway init error handling."""
@@ -218,6 +326,42 @@ class TestRailwayInitErrors:
             finally:
                 os.chdir(original_cwd)
 
+    def test_init_dangling_symlink_fails(self):
+        """Should fail if the target is a symlink, even a dangling one."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                (Path(tmpdir) / "linked_project").symlink_to(Path(tmpdir) / "missing")
+                result = runner.invoke(app, ["init", "linked_project"])
+                assert result.exit_code != 0
+                assert "already exists" in result.output.lower()
+                assert not (Path(tmpdir) / "missing").exists()
+            finally:
+                os.chdir(original_cwd)
+
+    def test_init_failure_removes_partial_project(self):
+        """A failed scaffold should not leave a half-written project behind."""
+        from unittest.mock import patch
+
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                with patch(
+                    "railway.cli.init._create_dag_directories",
+                    side_effect=OSError("disk full"),
+                ):
+                    result = runner.invoke(app, ["init", "broken_project"])
+                assert result.exit_code != 0
+                assert not (Path(tmpdir) / "broken_project").exists()
+            finally:
+                os.chdir(original_cwd)
+
     def test_init_invalid_project_name(self):
         """Should normalize project names with dashes."""
         from railway.cli.main import app
@@ -234,6 +378,101 @@ class TestRailwayInitErrors:
                 os.chdir(original_cwd)
 
 
+class TestRailwayInitExistingOk:
+    """Test railway init --existing-ok."""
+
+    def test_existing_ok_scaffolds_existing_directory(self):
+        """--existing-ok should scaffold into an existing directory."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                project = Path(tmpdir) / "existing_project"
+                project.mkdir()
+                (project / "notes.txt").write_text("keep me")
+                result = runner.invoke(app, ["init", "existing_project", "--existing-ok"])
+                assert result.exit_code == 0
+                assert (project / "pyproject.toml").exists()
+                assert (project / "notes.txt").read_text() == "keep me"
+            finally:
+                os.chdir(original_cwd)
+
+    def test_existing_ok_keeps_gitignore_and_conftest(self):
+        """--existing-ok should not overwrite user .gitignore or tests/conftest.py."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                project = Path(tmpdir) / "existing_project"
+                (project / "tests").mkdir(parents=True)
+                (project / ".gitignore").write_text("custom\n")
+                (project / "tests" / "conftest.py").write_text("# custom\n")
+                result = runner.invoke(app, ["init", "existing_project", "--existing-ok"])
+                assert result.exit_code == 0
+                assert (project / ".gitignore").read_text() == "custom\n"
+                assert (project / "tests" / "conftest.py").read_text() == "# custom\n"
+                assert "Kept existing files" in result.output
+                assert os.path.join("tests", "conftest.py") in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_existing_ok_without_existing_files_reports_nothing_kept(self):
+        """--existing-ok into an empty directory should not list kept files."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                (Path(tmpdir) / "existing_project").mkdir()
+                result = runner.invoke(app, ["init", "existing_project", "--existing-ok"])
+                assert result.exit_code == 0
+                assert "Kept existing files" not in result.output
+            finally:
+                os.chdir(original_cwd)
+
+    def test_existing_ok_rejects_existing_file(self):
+        """--existing-ok should still fail when the target is not a directory."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                (Path(tmpdir) / "existing_project").write_text("")
+                result = runner.invoke(app, ["init", "existing_project", "--existing-ok"])
+                assert result.exit_code != 0
+                assert "not a directory" in result.output.lower()
+            finally:
+                os.chdir(original_cwd)
+
+    def test_existing_ok_failure_keeps_existing_directory(self):
+        """A failed --existing-ok scaffold should not delete the user's directory."""
+        from unittest.mock import patch
+
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                project = Path(tmpdir) / "existing_project"
+                project.mkdir()
+                with patch(
+                    "railway.cli.init._create_dag_directories",
+                    side_effect=OSError("disk full"),
+                ):
+                    result = runner.invoke(app, ["init", "existing_project", "--existing-ok"])
+                assert result.exit_code != 0
+                assert project.is_dir()
+            finally:
+                os.chdir(original_cwd)
+
+
 class TestRailwayInitOutput:
     """Test railway init output messages."""
 
@@ -289,6 +528,81 @@ class TestPyprojectMypyConfig:
         assert "ignore_missing_imports = true" in content
 
 
+class TestValidateProjectName:
+    """Test _validate_project_name normalization and validation."""
+
+    def test_dashes_are_normalized(self) -> None:
+        from railway.cli.init import _validate_project_name
+
+        assert _validate_project_name("my-project") == "my_project"
+
+    def test_leading_dash_is_normalized(self) -> None:
+        from railway.cli.init import _validate_project_name
+
+        assert _validate_project_name("-project") == "_project"
+
+    def test_ascii_identifier_accepted(self) -> None:
+        from railway.cli.init import _validate_project_name
+
+        assert _validate_project_name("_project2") == "_project2"
+
+    def test_non_ascii_identifier_accepted(self) -> None:
+        from railway.cli.init import _validate_project_name
+
+        assert _validate_project_name("プロジェクト") == "プロジェクト"
+
+    @pytest.mark.parametrize("name", ["1project", "my project", "my.project", ""])
+    def test_invalid_name_rejected(self, name: str) -> None:
+        import typer
+
+        from railway.cli.init import _validate_project_name
+
+        with pytest.raises(typer.BadParameter):
+            _validate_project_name(name)
+
+
+class TestCreateDirectories:
+    """Test _create_directories."""
+
+    @pytest.mark.parametrize("dir_fd_supported", [True, False])
+    def test_creates_all_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dir_fd_supported: bool
+    ) -> None:
+        from railway.cli.init import _PROJECT_DIRECTORIES, _create_directories
+
+        if not dir_fd_supported:
+            monkeypatch.setattr(os, "supports_dir_fd", set())
+        project = tmp_path / "proj"
+        _create_directories(project)
+        _create_directories(project)  # existing directories are tolerated
+        for relative in _PROJECT_DIRECTORIES:
+            assert (project / relative).is_dir()
+
+
+class TestSplitTemplate:
+    """Test _split_template / _write_template pre-split rendering."""
+
+    def test_multiple_slots_match_substitute(self, tmp_path: Path) -> None:
+        from string import Template
+
+        from railway.cli.init import _split_template, _write_template
+
+        template = Template("a=$a, b=$b, again=$a, $$literal\n")
+        split = _split_template(template, ("a", "b"))
+        _write_template(tmp_path / "out", split, a="x", b="日本")
+        expected = template.substitute(a="x", b="日本").encode()
+        assert (tmp_path / "out").read_bytes() == expected
+
+    def test_default_slot_is_project_name(self) -> None:
+        from string import Template
+
+        from railway.cli.init import _split_template
+
+        statics, slots = _split_template(Template("[$project_name]"))
+        assert statics == (b"[", b"]")
+        assert slots == ("project_name",)
+
+
 # =============================================================================
 # Issue 15-02: バージョン固定
 # =============================================================================
@@ -354,6 +668,16 @@ class TestInitTestStructure:
         _create_init_files(tmp_path)
         assert (tmp_path / "tests" / "__init__.py").exists()
 
+    def test_tests_init_py_is_empty(self, tmp_path: Path) -> None:
+        from railway.cli.init import _create_init_files
+
+        (tmp_path / "tests" / "nodes").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "src" / "nodes").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "src" / "common").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "tests" / "__init__.py").write_text("stale")
+        _create_init_files(tmp_path)
+        assert (tmp_path / "tests" / "__init__.py").read_bytes() == b""
+
 
 class TestCreateEntryTestPath:
     """Test that _create_entry uses correct test path."""
@@ -370,7 +694,7 @@ class TestCreateEntryTestPath:
         original_cwd = os.getcwd()
         try:
             os.chdir(tmp_path)
-            _create_entry_test("my_entry")
+            _create_entry_test(str(tmp_path), "my_entry")
             assert (tests_dir / "test_my_entry.py").exists()
         finally:
             os.chdir(original_cwd)
@@ -399,6 +723,14 @@ class TestTutorialSyncConsistency:
         # Should have an advanced section about module specification
         assert "module" in content.lower()
 
+    def test_tutorial_file_matches_rendered_content(self, tmp_path: Path) -> None:
+        """Chunked TUTORIAL.md write should match the rendered template."""
+        from railway.cli.init import _create_tutorial_md, _get_tutorial_content
+
+        _create_tutorial_md(tmp_path, "greeting")
+        content = (tmp_path / "TUTORIAL.md").read_bytes()
+        assert content == _get_tutorial_content("greeting").encode("utf-8")
+
     def test_tutorial_separate_files_not_combined(self, tmp_path: Path) -> None:
         """Main body should use separate files, not combined greet.py."""
         from railway.cli.init import _create_tutorial_md
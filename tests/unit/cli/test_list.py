@@ -197,3 +197,101 @@ class TestRailwayListErrors:
                 # Should indicate no entries/nodes found
             finally:
                 os.chdir(original_cwd)
+
+
+class TestExtractModuleDocstring:
+    """Test _extract_module_docstring fast path against ast.get_docstring."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '"""Summary line."""\n',
+            '#!/usr/bin/env python\n# comment\n\n"""\n    Summary line.\n\n    Body.\n"""\n',
+            "'''Single-quoted summary.'''  # trailing comment\nimport os\n",
+            '"""First""" + suffix\n',
+            '"""First""" """Second"""\n',
+            '"""Escaped \\x41 summary."""\n',
+            'r"""Raw summary."""\n',
+            '"Short summary."\n',
+            'import os\n"""Not a docstring."""\n',
+            '"""\n\n"""\n',
+            '"""Summary "quoted"."""\n',
+            "",
+        ],
+    )
+    def test_matches_ast(self, content: str) -> None:
+        import ast
+
+        from railway.cli.list import _extract_module_docstring
+
+        docstring = ast.get_docstring(ast.parse(content))
+        expected = docstring.split("\n")[0].strip() if docstring else None
+        assert _extract_module_docstring(content) == expected
+
+    def test_invalid_source_without_docstring(self) -> None:
+        from railway.cli.list import _extract_module_docstring
+
+        assert _extract_module_docstring("def broken(:\n") is None
+
+    def test_longer_closing_quote_run_is_invalid(self) -> None:
+        from railway.cli.list import _extract_module_docstring
+
+        assert _extract_module_docstring('"""abc""""\n') is None
+
+    def test_syntax_error_after_docstring_is_not_checked(self) -> None:
+        """The fast path reads only the docstring, not the rest of the file."""
+        from railway.cli.list import _extract_module_docstring
+
+        content = '"""Summary line."""\n\ndef broken(:\n'
+        assert _extract_module_docstring(content) == "Summary line."
+
+
+class TestCountTests:
+    """Test _count_tests directory walk."""
+
+    def test_counts_nested_test_files(self, tmp_path: Path) -> None:
+        from railway.cli.list import _count_tests
+
+        for relative in ("test_a.py", "nodes/test_b.py", "nodes/deep/test_c.py", "conftest.py"):
+            path = tmp_path / "tests" / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        assert _count_tests(str(tmp_path)) == 3
+
+    def test_missing_tests_dir(self, tmp_path: Path) -> None:
+        from railway.cli.list import _count_tests
+
+        assert _count_tests(str(tmp_path)) == 0
+
+
+class TestAnalyzeEntryFile:
+    """Test _analyze_entry_file source reading."""
+
+    def test_crlf_source(self, tmp_path: Path) -> None:
+        from railway.cli.list import _analyze_entry_file
+
+        entry = tmp_path / "src" / "report.py"
+        entry.parent.mkdir()
+        entry.write_bytes(
+            b'"""Daily report.\r\n\r\nDetails.\r\n"""\r\n@entry_point\r\ndef main():\r\n    pass\r\n'
+        )
+        info = _analyze_entry_file("report", str(entry), os.path.join("src", "report.py"))
+        assert info is not None
+        assert info["description"] == "Daily report."
+        assert info["path"] == os.path.join("src", "report.py")
+
+
+class TestIsRailwayProject:
+    """Test _is_railway_project."""
+
+    def test_src_directory(self, tmp_path: Path) -> None:
+        from railway.cli.list import _is_railway_project
+
+        (tmp_path / "src").mkdir()
+        assert _is_railway_project(str(tmp_path))
+
+    def test_src_file_is_not_a_project(self, tmp_path: Path) -> None:
+        from railway.cli.list import _is_railway_project
+
+        (tmp_path / "src").touch()
+        assert not _is_railway_project(str(tmp_path))
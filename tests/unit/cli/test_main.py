@@ -0,0 +1,51 @@
+"""Tests for the railway CLI entry point."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+class TestLazyCommands:
+    """Subcommand modules are imported only when needed."""
+
+    def test_import_main_does_not_import_subcommands(self):
+        code = (
+            "import sys, railway.cli.main; "
+            "print(sorted(m for m in sys.modules if m.startswith('railway.cli.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "['railway.cli.main']"
+
+    def test_import_main_does_not_resolve_version(self):
+        code = "import railway, railway.cli.main; print('__version__' in vars(railway))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_version_option(self):
+        import railway
+        from railway.cli.main import app
+
+        result = runner.invoke(app, ["--version"])
+        assert result.exit_code == 0
+        assert result.output.strip() == f"railway {railway.__version__}"
+
+    def test_help_lists_commands_in_order(self):
+        from railway.cli.main import _LAZY_COMMANDS, app
+
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        positions = [result.output.index(f" {name} ") for name in _LAZY_COMMANDS]
+        assert positions == sorted(positions)
+
+    def test_unknown_command_fails(self):
+        from railway.cli.main import app
+
+        result = runner.invoke(app, ["no-such-command"])
+        assert result.exit_code != 0
@@ -185,6 +185,69 @@ class TestRailwayNewOptions:
                 assert result.exit_code != 0
                 output = result.output.lower() if result.output else ""
                 assert "exists" in output
+                existing = Path(tmpdir) / "src" / "nodes" / "existing.py"
+                assert existing.read_text() == "# Old"
+            finally:
+                os.chdir(original_cwd)
+
+    def test_new_force_rerun_leaves_unchanged_node_alone(self):
+        """--force で内容が同一なら書き込みをスキップする。"""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _setup_project_dir(tmpdir)
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                assert runner.invoke(app, ["new", "node", "fetch"]).exit_code == 0
+                node_file = Path(tmpdir) / "src" / "nodes" / "fetch.py"
+                content = node_file.read_bytes()
+                os.utime(node_file, (1_000_000, 1_000_000))
+
+                result = runner.invoke(app, ["new", "node", "fetch", "--force"])
+                assert result.exit_code == 0
+                assert node_file.read_bytes() == content
+                assert node_file.stat().st_mtime == 1_000_000
+            finally:
+                os.chdir(original_cwd)
+
+    def test_new_force_keeps_existing_node_test(self):
+        """--force overwrites the node but never an existing test file."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _setup_project_dir(tmpdir)
+            test_file = Path(tmpdir) / "tests" / "nodes" / "test_existing.py"
+            test_file.parent.mkdir(parents=True)
+            test_file.write_text("# My tests")
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                result = runner.invoke(app, ["new", "node", "existing", "--force"])
+                assert result.exit_code == 0
+                assert test_file.read_text() == "# My tests"
+                assert (Path(tmpdir) / "src" / "nodes" / "existing.py").exists()
+            finally:
+                os.chdir(original_cwd)
+
+    def test_new_contract_without_force_keeps_existing(self):
+        """Existing contract is left untouched without --force."""
+        from railway.cli.main import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _setup_project_dir(tmpdir)
+            contracts_dir = Path(tmpdir) / "src" / "contracts"
+            contracts_dir.mkdir()
+            existing = contracts_dir / "user_result.py"
+            existing.write_text("# Old")
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(tmpdir)
+                result = runner.invoke(app, ["new", "contract", "UserResult"])
+                assert result.exit_code != 0
+                assert existing.read_text() == "# Old"
+                # 既存ディレクトリには __init__.py を追加しない
+                assert not (contracts_dir / "__init__.py").exists()
             finally:
                 os.chdir(original_cwd)
 
@@ -288,3 +351,120 @@ class TestDagEntryTemplateTrace:
         trace_pos = code.index("[trace]")
         result_pos = code.index("完了")
         assert trace_pos < result_pos
+
+
+class TestModuleLevelTemplates:
+    """モジュールレベルに置いたテンプレートの展開テスト。"""
+
+    @pytest.mark.parametrize(
+        "getter",
+        [
+            "_get_contract_template",
+            "_get_entity_contract_template",
+            "_get_params_contract_template",
+            "_get_entry_template",
+            "_get_entry_example_template",
+            "_get_dag_entry_template",
+            "_get_dag_entry_template_pending_sync",
+            "_get_dag_node_standalone_template",
+            "_get_dag_node_context_template",
+            "_get_dag_node_test_standalone_template",
+            "_get_node_template",
+            "_get_node_example_template",
+            "_get_entry_test_template",
+            "_get_node_test_template",
+        ],
+    )
+    def test_placeholders_are_filled(self, getter: str) -> None:
+        """全てのプレースホルダが置換され、valid Python になること。"""
+        import railway.cli.new as new_module
+
+        code = getattr(new_module, getter)("fetch_data")
+        assert "$" not in code
+        assert "fetch_data" in code
+        compile(code, "<test>", "exec")
+
+    def test_repeated_calls_render_independently(self) -> None:
+        """同じテンプレートを別の名前で続けて展開できること。"""
+        from railway.cli.new import _get_node_template
+
+        first = _get_node_template("alpha")
+        second = _get_node_template("beta")
+        assert "def alpha(" in first
+        assert "def beta(" in second
+        assert "alpha" not in second
+
+
+class TestNameConversion:
+    """名前変換ヘルパーのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("UsersFetchResult", "users_fetch_result"),
+            ("HTTPResponse", "http_response"),
+            ("Report2Params", "report2_params"),
+            ("simple", "simple"),
+        ],
+    )
+    def test_camel_to_snake(self, name: str, expected: str) -> None:
+        from railway.cli.new import _camel_to_snake
+
+        assert _camel_to_snake(name) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("fetch_data", "FetchData"),
+            ("step2go", "Step2Go"),
+            ("x", "X"),
+        ],
+    )
+    def test_snake_to_class(self, name: str, expected: str) -> None:
+        from railway.cli.new import _snake_to_class
+
+        assert _snake_to_class(name) == expected
+
+
+class TestWriteFile:
+    """ファイル書き込みヘルパーのテスト。"""
+
+    def test_write_file_replaces_content_as_utf8(self, tmp_path: Path) -> None:
+        from railway.cli.new import _write_file
+
+        path = tmp_path / "entry.py"
+        path.write_text("# a much longer previous content\n" * 10)
+        _write_file(path, '"""エントリポイント。"""\n')
+        assert path.read_bytes() == '"""エントリポイント。"""\n'.encode()
+
+    def test_write_new_file_skips_existing(self, tmp_path: Path) -> None:
+        from railway.cli._fs import write_new_file
+
+        path = tmp_path / "test_node.py"
+        assert write_new_file(path, b"first\n") is True
+        assert write_new_file(path, b"second\n") is False
+        assert path.read_text() == "first\n"
+
+    def test_overwrite_file_skips_identical_content(self, tmp_path: Path) -> None:
+        from railway.cli.new import _overwrite_file
+
+        path = tmp_path / "node.py"
+        path.write_text("same\n")
+        os.utime(path, (1_000_000, 1_000_000))
+        _overwrite_file(path, "same\n")
+        assert path.stat().st_mtime == 1_000_000
+
+    def test_overwrite_file_replaces_changed_content(self, tmp_path: Path) -> None:
+        from railway.cli.new import _overwrite_file
+
+        path = tmp_path / "node.py"
+        path.write_text("old content that is longer\n")
+        _overwrite_file(path, "new\n")
+        assert path.read_text() == "new\n"
+
+    def test_overwrite_file_creates_missing(self, tmp_path: Path) -> None:
+        from railway.cli.new import _overwrite_file
+
+        path = tmp_path / "node.py"
+        _overwrite_file(path, "new\n")
+        assert path.read_text() == "new\n"
@@ -262,3 +262,32 @@ class TestRailwayNewNodeInputValidation:
                     assert "DataContract" in content
             finally:
                 os.chdir(original_cwd)
+
+
+class TestContractImportLines:
+    """Test import-line generation for typed templates."""
+
+    def test_duplicate_types_imported_once_in_order(self):
+        """Repeated contract types should be imported once, first occurrence first."""
+        from railway.cli.new import _contract_import_lines
+
+        lines = _contract_import_lines(
+            "Result",
+            [("a", "UserData"), ("b", "Result"), ("c", "UserData"), ("d", "Extra")],
+        )
+        assert lines == [
+            "from contracts.result import Result",
+            "from contracts.user_data import UserData",
+            "from contracts.extra import Extra",
+        ]
+
+    def test_typed_templates_share_deduplicated_imports(self):
+        """Both typed templates should emit each contract import once."""
+        from railway.cli.new import _get_typed_node_template, _get_typed_node_test_template
+
+        inputs = [("users", "UsersFetchResult"), ("more", "UsersFetchResult")]
+        node = _get_typed_node_template("merge", "UsersFetchResult", inputs)
+        test = _get_typed_node_test_template("merge", "UsersFetchResult", inputs)
+        line = "from contracts.users_fetch_result import UsersFetchResult"
+        assert node.count(line) == 1
+        assert test.count(line) == 1
@@ -231,6 +231,44 @@ class TestFindLatestYaml:
 
         assert set(entries) == {"entry2", "other"}
 
+    def test_find_all_entrypoints_sorted_and_filtered(self, tmp_path: Path):
+        """Should return sorted names and ignore non-matching files."""
+        from railway.cli.sync import find_all_entrypoints
+
+        (tmp_path / "zeta_20250101.yml").write_text("")
+        (tmp_path / "alpha_20250101.yml").write_text("")
+        (tmp_path / "alpha_draft.yml").write_text("")
+        (tmp_path / "beta_20250101.yaml").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        assert find_all_entrypoints(tmp_path) == ["alpha", "zeta"]
+
+    def test_find_all_entrypoints_missing_dir(self, tmp_path: Path):
+        """Should return an empty list when the directory is missing."""
+        from railway.cli.sync import find_all_entrypoints
+
+        assert find_all_entrypoints(tmp_path / "missing") == []
+
+    def test_graphs_path_is_a_file(self, tmp_path: Path):
+        """Should return nothing when transition_graphs is a plain file."""
+        from railway.cli.sync import find_all_entrypoints, find_latest_yaml
+
+        graphs_file = tmp_path / "transition_graphs"
+        graphs_file.write_text("")
+
+        assert find_all_entrypoints(graphs_file) == []
+        assert find_latest_yaml(graphs_file, "wf") is None
+
+    def test_unreadable_graphs_dir(self, tmp_path: Path):
+        """Should return nothing when transition_graphs cannot be listed."""
+        from unittest.mock import patch
+
+        from railway.cli.sync import find_all_entrypoints, find_latest_yaml
+
+        with patch("railway.cli.sync.os.scandir", side_effect=PermissionError):
+            assert find_all_entrypoints(tmp_path) == []
+            assert find_latest_yaml(tmp_path, "wf") is None
+
 
 class TestConvertYamlIfOldFormat:
     """Test _convert_yaml_if_old_format function."""